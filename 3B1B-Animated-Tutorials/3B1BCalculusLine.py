@@ -1,27 +1,111 @@
-from manim import *
-
-
-def dx_circle(x_min=0, x_max=3, dx=0.1):
-    circles = VGroup()
-    for x in np.arange(x_min, x_max, dx):
-        c = Circle(radius=x, stroke_width=4, stroke_color=[BLUE, GREEN])
-        circles.add(c)
-    return circles
+import sys
+from pathlib import Path
 
+from manim import *
 
-def dx_circumferences(x_min=0, x_max=3, dx=0.1):
-    circumferences = VGroup()
-    for x in np.arange(x_min, x_max, dx):
-        circumf = Rectangle(
-            width=2 * x * PI,
-            height=dx,
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from helpers.lod import circle_points, lod_segments
+
+
+class DxPool(VGroup):
+    """One shape for each of x_min, x_min + dx, ... below x_max.
+
+    Changing dx keeps the existing shapes: their points are computed for all
+    of them in one vectorized pass by `layout`, which is called with the xs of
+    the shapes once dx is set and returns one (n, 3) array per shape. Only the
+    difference in count is added or removed. Removed shapes are kept for when
+    dx grows smaller again.
+    """
+
+    def __init__(self, template, layout, x_min=0, x_max=3, dx=0.1, **kwargs):
+        super().__init__(**kwargs)
+        self.template = template
+        self.layout = layout
+        self.x_min = x_min
+        self.x_max = x_max
+        self.dx = None
+        self.pool = []
+        self.set_dx(dx)
+
+    def set_dx(self, dx):
+        if dx == self.dx:
+            return self
+        xs = np.arange(self.x_min, self.x_max, dx)
+        while len(self.pool) < len(xs):
+            self.pool.append(self.template.copy())
+        n_shown = len(self.submobjects)
+        if n_shown > len(xs):
+            self.remove(*self.submobjects[len(xs) :])
+        else:
+            self.add(*self.pool[n_shown : len(xs)])
+        self.dx = dx
+        for shape, points in zip(self.submobjects, self.layout(xs), strict=True):
+            shape.points = points
+        return self
+
+    def track(self, tracker):
+        """Follows the value of a ValueTracker as dx with an updater."""
+        return self.add_updater(lambda m: m.set_dx(tracker.get_value()))
+
+
+def circle_layout(xs):
+    """Returns the points of circles of radius xs around the origin."""
+    segments = lod_segments(xs)
+    points = [None] * len(xs)
+    # circles with the same number of curves are built in one broadcast
+    for n in np.unique(segments):
+        indices = np.flatnonzero(segments == n)
+        circles = xs[indices, None, None] * circle_points(n)
+        for i, circle in zip(indices, circles, strict=True):
+            points[i] = circle
+    return points
+
+
+class DxCircles(DxPool):
+    """Concentric circles of radius x around the origin.
+
+    Each circle gets as many curves as its size on screen needs, so the many
+    small ones are cheap to draw.
+    """
+
+    def __init__(self, x_min=0, x_max=3, dx=0.1, **kwargs):
+        template = Circle(radius=1, stroke_width=4, stroke_color=[BLUE, GREEN])
+        super().__init__(template, circle_layout, x_min, x_max, dx, **kwargs)
+
+
+class DxCircumferences(DxPool):
+    """Rectangles of width 2 pi x and height dx, stacked in the lower left."""
+
+    buff = 0.1
+
+    def __init__(self, x_min=0, x_max=3, dx=0.1, **kwargs):
+        template = Rectangle(
+            width=1,
+            height=1,
             stroke_color=[BLUE, GREEN],
             fill_color=[BLUE, GREEN],
             fill_opacity=0.75,
         )
-        circumferences.add(circumf)
-    circumferences.arrange(DOWN, buff=0.1).to_edge(DL)
-    return circumferences
+        super().__init__(template, self.stack_layout, x_min, x_max, dx, **kwargs)
+
+    def stack_layout(self, xs):
+        dx = self.dx
+        # the same as arrange(DOWN, buff=self.buff).to_edge(DL)
+        widths = 2 * PI * xs
+        heights = np.full(len(xs), dx)
+        top = (
+            -config.frame_y_radius
+            + DEFAULT_MOBJECT_TO_EDGE_BUFFER
+            + len(xs) * dx
+            + (len(xs) - 1) * self.buff
+        )
+        centers = np.zeros((len(xs), 3))
+        centers[:, 0] = (
+            -config.frame_x_radius + DEFAULT_MOBJECT_TO_EDGE_BUFFER + widths.max() / 2
+        )
+        centers[:, 1] = top - dx / 2 - np.arange(len(xs)) * (dx + self.buff)
+        scales = np.stack([widths, heights, np.ones(len(xs))], axis=1)
+        return self.template.points * scales[:, None, :] + centers[:, None, :]
 
 
 class CircleCalculus(Scene):
@@ -36,10 +120,8 @@ class CircleCalculus(Scene):
 
         k = ValueTracker(0.2)
 
-        circles = always_redraw(lambda: dx_circle(x_min=0, x_max=1, dx=k.get_value()))
-        circumferences = always_redraw(
-            lambda: dx_circumferences(x_min=0, x_max=1, dx=k.get_value())
-        )
+        circles = DxCircles(x_min=0, x_max=1, dx=k.get_value()).track(k)
+        circumferences = DxCircumferences(x_min=0, x_max=1, dx=k.get_value()).track(k)
 
         self.add(circles, circumferences)
         self.wait()
@@ -100,10 +182,8 @@ class Thumbnail(Scene):
 
         k = ValueTracker(0.05)
 
-        circles = always_redraw(lambda: dx_circle(x_min=0, x_max=2, dx=k.get_value()))
-        circumferences = always_redraw(
-            lambda: dx_circumferences(x_min=0, x_max=1, dx=k.get_value())
-        )
+        circles = DxCircles(x_min=0, x_max=2, dx=k.get_value()).track(k)
+        circumferences = DxCircumferences(x_min=0, x_max=1, dx=k.get_value()).track(k)
 
         self.add(circles, circumferences, axes)
         area_under_curve = VGroup()
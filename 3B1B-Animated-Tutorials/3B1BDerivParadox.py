@@ -1,7 +1,14 @@
+import sys
+from pathlib import Path
+
 from manim import *
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from helpers.secant import SecantSlopeGroup
+from helpers.static_layer import StaticLayerScene
+
 
-class Paradox(Scene):
+class Paradox(StaticLayerScene):
     def construct(self):
         axes = (
             Axes(
@@ -23,37 +30,22 @@ class Paradox(Scene):
         x = ValueTracker(7)
         dx = ValueTracker(2)
 
-        secant = always_redraw(
-            lambda: axes.get_secant_slope_group(
-                x=x.get_value(),
-                graph=func,
-                dx=dx.get_value(),
-                dx_line_color=YELLOW,
-                dy_line_color=ORANGE,
-                dx_label="dx",
-                dy_label="dy",
-                secant_line_color=GREEN,
-                secant_line_length=8,
-            )
-        )
-        dot1 = always_redraw(
-            lambda: Dot()
-            .scale(0.7)
-            .move_to(axes.c2p(x.get_value(), func.underlying_function(x.get_value())))
-        )
-        dot2 = always_redraw(
-            lambda: Dot()
-            .scale(0.7)
-            .move_to(
-                axes.c2p(
-                    (x).get_value() + dx.get_value(),
-                    func.underlying_function(x.get_value() + dx.get_value()),
-                )
-            )
+        secant = SecantSlopeGroup(
+            axes,
+            func,
+            x,
+            dx,
+            dx_line_color=YELLOW,
+            dy_line_color=ORANGE,
+            dx_label="dx",
+            dy_label="dy",
+            secant_line_color=GREEN,
+            secant_line_length=8,
+            dot_radius=0.7 * DEFAULT_DOT_RADIUS,
         )
 
-        self.add(axes, axes_labels, func)
-        self.play(Create(VGroup(dot1, dot2, secant)))
+        self.add_static(axes, axes_labels, func)
+        self.play(Create(secant))
         self.play(dx.animate.set_value(0.001), run_time=8)
         self.wait(2)
         self.play(x.animate.set_value(1), run_time=5)
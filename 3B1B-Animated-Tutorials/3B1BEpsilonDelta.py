@@ -1,47 +1,46 @@
+import sys
+from pathlib import Path
+
 from manim import *
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from helpers.dashed_line import AnchoredDashedLine
+from helpers.plotting import SampledGraph
+from helpers.static_layer import StaticLayerScene
 
-def get_epsilon_lines(x, dx, graph, axes, line_length=20, color=WHITE):
-    result = VGroup()
-    line1 = (
-        DashedLine(start=ORIGIN, end=line_length * RIGHT)
-        .move_to(axes.c2p(x + dx, graph.underlying_function(x + dx)))
-        .set_color(color)
-    )
-    dot1 = (
-        Circle(radius=0.07)
-        .set_color(color)
-        .move_to(axes.c2p(x + dx, graph.underlying_function(x + dx)))
-    )
 
-    line2 = (
-        DashedLine(start=ORIGIN, end=line_length * RIGHT)
-        .move_to(axes.c2p(x - dx, graph.underlying_function(x - dx)))
-        .set_color(color)
-    )
-    dot2 = (
-        Circle(radius=0.07)
-        .set_color(color)
-        .move_to(axes.c2p(x - dx, graph.underlying_function(x - dx)))
-    )
+def get_epsilon_lines(x, dx, graph, line_length=20, color=WHITE):
+    result = VGroup()
+    line1 = AnchoredDashedLine(start=ORIGIN, end=line_length * RIGHT).set_color(color)
+    line2 = AnchoredDashedLine(start=ORIGIN, end=line_length * RIGHT).set_color(color)
+    dot1 = Circle(radius=0.07).set_color(color)
+    dot2 = Circle(radius=0.07).set_color(color)
     result.add(line1, line2, dot1, dot2)
-    return result
+    return update_epsilon_lines(result, x, dx, graph)
+
+
+def update_epsilon_lines(lines, x, dx, graph):
+    line1, line2, dot1, dot2 = lines
+    for line, dot, x_end in [(line1, dot1, x + dx), (line2, dot2, x - dx)]:
+        point = graph.point_at(x_end)
+        line.move_anchor_to(point)
+        dot.move_to(point)
+    return lines
 
 
 def get_delta_lines(x, dx, axes, line_length=20, color=WHITE):
     result = VGroup()
-    line1 = (
-        DashedLine(start=ORIGIN, end=line_length * UP)
-        .move_to(axes.c2p(x + dx, 0))
-        .set_color(color)
-    )
-    line2 = (
-        DashedLine(start=ORIGIN, end=line_length * UP)
-        .move_to(axes.c2p(x - dx, 0))
-        .set_color(color)
-    )
+    line1 = AnchoredDashedLine(start=ORIGIN, end=line_length * UP).set_color(color)
+    line2 = AnchoredDashedLine(start=ORIGIN, end=line_length * UP).set_color(color)
     result.add(line1, line2)
-    return result
+    return update_delta_lines(result, x, dx, axes)
+
+
+def update_delta_lines(lines, x, dx, axes):
+    line1, line2 = lines
+    line1.move_anchor_to(axes.c2p(x + dx, 0))
+    line2.move_anchor_to(axes.c2p(x - dx, 0))
+    return lines
 
 
 def get_faded_undefined_epsilon_delta_lines(
@@ -51,9 +50,7 @@ def get_faded_undefined_epsilon_delta_lines(
     epsilon_line = (
         DashedLine(start=ORIGIN, end=line_length * RIGHT)
         .set_color(color)
-        .move_to(
-            axes.c2p(x + 0.0000001, graph.underlying_function(x + 0.0000001))
-        )  # NEED to add the +0.000001 as undefined point otherwise
+        .move_to(graph.point_at(x))
         .set_opacity(opacity)
     )
     delta_line = (
@@ -68,27 +65,20 @@ def get_faded_undefined_epsilon_delta_lines(
 
 def get_output_limit_range(x, graph, dx, range, axes):
     result = VGroup()
-    dot = (
-        Circle(radius=0.07)
-        .set_color(YELLOW)
-        .move_to(
-            axes.c2p(x + 0.000001, graph.underlying_function(x + 0.000001))
-        )  # Need to +0.00001 as point is undefined otherwise
+    dot = Circle(radius=0.07).set_color(YELLOW).move_to(graph.point_at(x))
+    line = SampledGraph(
+        axes,
+        graph.underlying_function,
+        [x - range, x + range],
+        dx=dx,
+        exclude=[x],
+        stroke_color=YELLOW,
     )
-    result.add(dot)
-    for x in np.arange(x - range, x + range, dx):
-        if 0 - dx < x < 0 + dx:
-            line = VectorizedPoint
-        else:
-            line = Line(
-                start=axes.c2p(x, graph.underlying_function(x)),
-                end=axes.c2p((x + dx), graph.underlying_function(x + dx)),
-            ).set_color(YELLOW)
-            result.add(line)
+    result.add(dot, line)
     return result
 
 
-class ED(Scene):
+class ED(StaticLayerScene):
     def construct(self):
         axes = Axes(
             x_range=[-8, 6, 2],
@@ -99,8 +89,8 @@ class ED(Scene):
         ).set_color(GREY)
         axes_labels = axes.get_axis_labels(x_label="x", y_label="f(x)")
 
-        graph = axes.plot(
-            lambda x: (((2 + x) ** 3 - 8)) / x, x_range=[-8, 2], color=BLUE
+        graph = SampledGraph(
+            axes, lambda x: ((2 + x) ** 3 - 8) / x, x_range=[-8, 2], color=BLUE
         )
 
         graph_label = (
@@ -111,12 +101,12 @@ class ED(Scene):
 
         dx = ValueTracker(1)
 
-        epsilon_lines = always_redraw(
-            lambda: get_epsilon_lines(x=0, dx=dx.get_value(), graph=graph, axes=axes)
-        )
+        epsilon_lines = get_epsilon_lines(
+            x=0, dx=dx.get_value(), graph=graph
+        ).add_updater(lambda m: update_epsilon_lines(m, 0, dx.get_value(), graph))
 
-        delta_lines = always_redraw(
-            lambda: get_delta_lines(x=0, dx=dx.get_value(), axes=axes)
+        delta_lines = get_delta_lines(x=0, dx=dx.get_value(), axes=axes).add_updater(
+            lambda m: update_delta_lines(m, 0, dx.get_value(), axes)
         )
 
         faded_undefined = get_faded_undefined_epsilon_delta_lines(
@@ -132,15 +122,8 @@ class ED(Scene):
             x=0, graph=graph, dx=0.02, range=0.5, axes=axes
         )
 
-        self.add(
-            axes,
-            axes_labels,
-            graph,
-            graph_label,
-            epsilon_lines,
-            delta_lines,
-            faded_undefined,
-        )
+        self.add_static(axes, axes_labels, graph, graph_label, faded_undefined)
+        self.add(epsilon_lines, delta_lines)
         self.wait()
         self.play(dx.animate.set_value(0.01), run_time=6, rate_func=there_and_back)
         self.play(Create(input_range))
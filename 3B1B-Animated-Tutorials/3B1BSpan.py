@@ -1,18 +1,24 @@
+import sys
+from pathlib import Path
+
 from manim import *
 
-HOME = "C:\manim\Manim_7_July\Projects\\assets\Images"
-HOME2 = "/home/rsoko/private/manim/icons"
-HOME3 = "C:\manim\Manim_7_July\Projects\\assets\Jay_SVG"
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from helpers.arrow_field import ArrowField
+from helpers.assets import icon_path
+from helpers.geometry import parallelogram_points
+from helpers.static_layer import StaticLayerScene
+from helpers.svg_cache import load_svg
 
 
 class StartingStuff(Scene):
     def construct(self):
-        play_icon1 = VGroup(SVGMobject(f"{HOME2}/youtube_icon.svg")).set_height(0.75)
+        play_icon1 = VGroup(load_svg(icon_path("youtube_icon"))).set_height(0.75)
 
         self.play(DrawBorderThenFill(play_icon1), run_time=2)
         self.play(play_icon1.animate.to_edge(UL))
         play_icons = (
-            VGroup(*[SVGMobject(f"{HOME2}/youtube_icon.svg") for k in range(10)])
+            VGroup(*[load_svg(icon_path("youtube_icon")) for k in range(10)])
             .set_height(0.75)
             .arrange(RIGHT, buff=0.2)
             .next_to(play_icon1, RIGHT, buff=0.2)
@@ -36,53 +42,35 @@ class StartingStuff(Scene):
         self.wait(2)
 
 
-def GetSpanningVectors(plane, x=-7, y=-4):
-    result = VGroup()
-    x = -7
-    y = -4
-    while x <= 7:
-        for y in np.arange(-4, 5):
-            if x <= 0:
-                point = (
-                    Dot(fill_color=[ORANGE, YELLOW], fill_opacity=0.75)
-                    .scale(0.5)
-                    .move_to(plane.c2p(x, y))
-                )
-                vec = (
-                    Line(
-                        start=ORIGIN,
-                        end=point.get_center(),
-                        tip_length=0.2,
-                        stroke_color=[BLUE, PINK],
-                    )
-                    .add_tip()
-                    .set_opacity(0.8)
-                )
-            else:
-                point = (
-                    Dot(fill_color=[YELLOW, ORANGE], fill_opacity=0.75)
-                    .scale(0.5)
-                    .move_to(plane.c2p(x, y))
-                )
-                vec = (
-                    Line(
-                        start=ORIGIN,
-                        end=point.get_center(),
-                        tip_length=0.2,
-                        stroke_color=[PINK, BLUE],
-                    )
-                    .add_tip()
-                    .set_opacity(0.8)
-                )
-            result.add(point, vec)
-        x += 1
-    return result
+def GetSpanningVectors(plane, x=-7, y=-4, x_max=7, y_max=4, step=1):
+    xs, ys = np.meshgrid(
+        np.arange(x, x_max + step / 2, step),
+        np.arange(y, y_max + step / 2, step),
+        indexing="ij",
+    )
+    origin = plane.c2p(0, 0)
+    ends = parallelogram_points(origin, plane.c2p(1, 0), plane.c2p(0, 1), xs, ys)
+    left = xs <= 0
+    return VGroup(
+        ArrowField(
+            ends[left],
+            start=origin,
+            stroke_color=[BLUE, PINK],
+            dot_color=[ORANGE, YELLOW],
+        ),
+        ArrowField(
+            ends[~left],
+            start=origin,
+            stroke_color=[PINK, BLUE],
+            dot_color=[YELLOW, ORANGE],
+        ),
+    )
 
 
-class VectorSpan(Scene):
+class VectorSpan(StaticLayerScene):
     def construct(self):
         plane1 = NumberPlane()
-        self.add(plane1)
+        self.add_static(plane1)
 
         span1 = GetSpanningVectors(plane=plane1, x=-7, y=-4)
 
@@ -1,7 +1,27 @@
-from manim import *
+import os
 import random
+import sys
+from pathlib import Path
+
+from manim import *
 
-HOME2 = "/home/rsoko/private/manim/icons"
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from helpers.assets import icon_path
+from helpers.binomial import BinomialAccumulator, proportions
+from helpers.fast_number import GlyphNumber
+from helpers.histogram import ArrayHistogram
+from helpers.producer import snapshots
+from helpers.redraw import cached_redraw
+from helpers.static_layer import StaticLayerScene
+from helpers.svg_cache import load_svg
+
+# run the large steps of the binomial simulation in a background thread, a
+# few frames ahead of the renderer; every play draws from its own generator
+# and the counts only change when a frame shows a step, so the frames stay
+# the same
+BACKGROUND_SIMULATION = bool(os.environ.get("BACKGROUND_SIMULATION"))
+# smaller steps are cheaper in the frame updater than handed to a thread
+BACKGROUND_MIN_EXPERIMENTS = 1000
 
 
 class Randomising(Scene):
@@ -14,7 +34,7 @@ class Randomising(Scene):
             else:
                 number.set_color(RED_C)
 
-        number = DecimalNumber()
+        number = GlyphNumber()
 
         self.add(number)
         self.play(UpdateFromFunc(number, randomize), run_time=3)
@@ -36,13 +56,13 @@ class MoreRandomising(Scene):
             results = VGroup()
             for num in numbers:
                 if num.get_value() > 0.2:
-                    win = SVGMobject(f"{HOME2}/green_tick.svg").set_color(GREEN)
+                    win = load_svg(icon_path("green_tick")).set_color(GREEN)
                     win.set(height=0.4)
                     win.next_to(num, DOWN, buff=0.25)
                     und = Underline(win).match_color(win)
                     results.add(win, und)
                 else:
-                    loss = SVGMobject(f"{HOME2}/cross.svg").set_color(RED_C)
+                    loss = load_svg(icon_path("cross")).set_color(RED_C)
                     loss.set(height=0.4)
                     loss.next_to(num, DOWN, buff=0.25)
                     und = Underline(loss).match_color(loss)
@@ -51,7 +71,7 @@ class MoreRandomising(Scene):
 
         numbers = VGroup()
         for x in range(10):
-            num = DecimalNumber()
+            num = GlyphNumber()
             numbers.add(num)
         numbers.arrange(RIGHT).to_edge(UP)
 
@@ -66,16 +86,18 @@ class MoreRandomising(Scene):
             self.wait(0.3)
 
 
-class CoinStack(Scene):
+class CoinStack(StaticLayerScene):
     def construct(self):
         numbers = VGroup()
         for x in range(10):
-            num = DecimalNumber()
+            num = GlyphNumber()
             numbers.add(num)
 
-        def randomize_numbers(numbers):
-            for num in numbers:
-                value = random.uniform(0, 1)
+        def draw_values():
+            return [random.uniform(0, 1) for _ in range(len(numbers))]
+
+        def show_numbers(numbers, values):
+            for num, value in zip(numbers, values):
                 num.set_value(value)
                 if value > 0.5:
                     num.set_color(BLUE_D)
@@ -103,7 +125,7 @@ class CoinStack(Scene):
             k = 0
             self.play(
                 numbers.animate.shift(DOWN * 0.5),
-                UpdateFromFunc(numbers, randomize_numbers),
+                UpdateFromFunc(numbers, lambda m: show_numbers(m, draw_values())),
             )
             new_results = get_results(numbers)
 
@@ -115,12 +137,21 @@ class CoinStack(Scene):
             score = Integer()
             score.set_value(k).next_to(new_results, RIGHT, buff=0.6).set_color(YELLOW_D)
             self.play(Write(score))
+            finished = VGroup(new_results, score)
             if k == 5:
                 box = SurroundingRectangle(score)
                 self.play(Create(box))
+                finished.add(box)
+            # finished rows never change again, they are drawn into the
+            # background layer, which is rasterized once per row
+            self.remove(*finished.get_family())
+            self.add_static(finished)
 
 
 class Binomial_Simulation(Scene):
+    background_simulation = BACKGROUND_SIMULATION
+    seed = None
+
     def construct(self):
         ##STARTING WITH ALL THE HELPER FUNCTIONS##
         def get_histogram(possible_outcomes):
@@ -155,111 +186,111 @@ class Binomial_Simulation(Scene):
             result.to_edge(DL)
             return result
 
-        def get_random_row(s=0.2, n=10):  # s is the probability of success
-            values = np.random.random(n)
+        def get_row(n=10):
+            # built once; every frame only changes values, colours and symbols
             nums = VGroup()
             syms = VGroup()
-            for x, value in enumerate(values):
-                num = DecimalNumber(value)
+            for x in range(n):
+                num = GlyphNumber(0)
                 num.set(height=0.25)
                 num.move_to(x * RIGHT)
-                num.positive = num.get_value() < s
-                if num.positive:
-                    num.set_color(GREEN)
-                    sym = SVGMobject(f"{HOME2}/green_tick.svg")
-                else:
-                    num.set_color(RED)
-                    sym = SVGMobject(f"{HOME2}/cross.svg")
-                if sym.stroke_width is None:
-                    sym.stroke_width = 0
-                sym.match_color(num)
-                sym.match_height(num)
-                sym.positive = num.positive
-                sym.next_to(num, DOWN, buff=0.25)
+                tick = load_svg(icon_path("green_tick")).set_color(GREEN)
+                cross = load_svg(icon_path("cross")).set_color(RED)
+                for sym in [tick, cross]:
+                    sym.match_height(num)
+                    sym.next_to(num, DOWN, buff=0.25)
+                # a slot holds both symbols and only the one for the outcome
+                # is opaque; the renderer collects the family of a playing
+                # mobject when the play starts, so it must not change during it
+                slot = VGroup(tick, cross)
+                slot.symbols = {True: tick, False: cross}
+                slot.positive = False
+                tick.set_opacity(0)
 
                 nums.add(num)
-                syms.add(sym)
+                syms.add(slot)
 
             row = VGroup(nums, syms)
             row.nums = nums
             row.syms = syms
-            row.n_positive = sum([m.positive for m in nums])
-
             row.center().to_edge(UP, buff=0)
             return row
 
-        def get_bars(histogram, data):
-            portions = np.array(data).astype(float)
-            total = portions.sum()
-            if total == 0:
-                portions[:] = 0
-            else:
-                portions /= total
-
-            bars = VGroup()
-
-            for x, prop in enumerate(portions):
-                p1 = VectorizedPoint().move_to(histogram[0].c2p(x, 0))
-                p2 = VectorizedPoint().move_to(histogram[0].c2p(x + 1, 0))
-                p3 = VectorizedPoint().move_to(histogram[0].c2p(x + 1, prop))
-                p4 = VectorizedPoint().move_to(histogram[0].c2p(x, prop))
-                points = VGroup(p1, p2, p3, p4)
-                bar = Rectangle().replace(points, stretch=True)
-                bar.set_style(
-                    fill_color=[YELLOW, GREEN],
-                    fill_opacity=0.8,
-                    stroke_color=[YELLOW, GREEN],
-                )
-                bars.add(bar)
-            return bars
-
-        data = np.zeros(11)  # Possible outcomes as an array
+        def set_row(row, values, s=0.2):  # s is the probability of success
+            for num, slot, value in zip(row.nums, row.syms, values, strict=True):
+                positive = bool(value < s)
+                num.set_value(value)
+                num.set_color(GREEN if positive else RED)
+                if positive != slot.positive:
+                    slot.symbols[positive].set_opacity(1)
+                    slot.symbols[not positive].set_opacity(0)
+                    slot.positive = positive
+            row.n_positive = int((values < s).sum())
+            return row.n_positive
+
+        outcomes = BinomialAccumulator(n_trials=10, p=0.2, rng=self.seed)
         histogram = get_histogram(possible_outcomes=11)
-        row = get_random_row(s=0.2, n=10)
-        bars = get_bars(histogram=histogram, data=data)
+        row = get_row(n=outcomes.n_trials)
+        set_row(row, outcomes.rng.random(outcomes.n_trials), s=outcomes.p)
+        bar_colors = 11 * [(YELLOW, GREEN)]
+        bar_colors[2] = (BLUE_B, BLUE_D)
+        bars = ArrayHistogram(
+            histogram[0],
+            proportions(outcomes.counts),
+            bar_colors=bar_colors,
+            fill_opacity=0.8,
+        )
 
         text_counter = Tex("Total trials: ").scale(0.6).to_edge(RIGHT, buff=2.5)
-        counter = always_redraw(
-            lambda: Integer()
-            .scale(0.6)
-            .set_value(sum(data))
-            .next_to(text_counter, RIGHT, buff=0.3)
+        counter = cached_redraw(
+            lambda: (
+                Integer()
+                .scale(0.6)
+                .set_value(outcomes.total)
+                .next_to(text_counter, RIGHT, buff=0.3)
+            ),
+            outcomes.counts,
         )
         arrow = Line(ORIGIN, DOWN * 0.8).add_tip().set_color(BLUE)
 
-        ##THE UPDATER FUNCTION##
-        def update(dummy, n_added_data_points=0):
-            new_row = get_random_row()
-
-            row.become(new_row)
-            count = sum([m.positive for m in new_row.nums])
-            data[count] += 1
-            if n_added_data_points:
-                values = np.random.random((n_added_data_points, 10))
-                counts = (values < 0.2).sum(1)
-                for i in range(len(data)):
-                    data[i] += (counts == i).sum()
-            bars.become(get_bars(histogram=histogram, data=data))
-            arrow.next_to(bars[count], UP, buff=0.1)
-            bars[2].set_style(
-                fill_color=[BLUE_B, BLUE_D], fill_opacity=0.8, stroke_color=BLUE
+        ##THE UPDATER FUNCTIONS##
+        # a step only reads `outcomes`; its new counts are added by the frame
+        # that shows it
+        def simulate(rng, n_added_data_points=0):
+            values = rng.random(outcomes.n_trials)
+            counts = outcomes.draw(n_added_data_points, rng)
+            counts[int((values < outcomes.p).sum())] += 1
+            return values, counts
+
+        def show(snapshot):
+            values, counts = snapshot
+            count = set_row(row, values, s=outcomes.p)
+            outcomes.counts += counts
+            bars.change_bar_values(proportions(outcomes.counts))
+            arrow.next_to(bars.get_bar_top(count), UP, buff=0.1)
+
+        def play_simulation(n_added_data_points, run_time):
+            background = (
+                self.background_simulation
+                and n_added_data_points >= BACKGROUND_MIN_EXPERIMENTS
             )
+            # steps computed ahead but never shown only use up this generator
+            rng = np.random.default_rng(outcomes.rng.integers(2**63))
+            with snapshots(
+                lambda: simulate(rng, n_added_data_points), background
+            ) as next_snapshot:
+                self.play(
+                    UpdateFromFunc(group, lambda m: show(next_snapshot())),
+                    run_time=run_time,
+                )
 
         self.add(histogram, row, bars, counter, arrow, text_counter)
 
         group = VGroup(row, bars, arrow)
-        self.play(UpdateFromFunc(group, lambda m: update(m, 0)), run_time=10)
-
-        self.play(
-            UpdateFromFunc(group, lambda m: update(m, 10)),
-            run_time=10,
-        )
-        # self.play(
-        #     UpdateFromFunc(group, lambda m: update(m, 100)),
-        #     run_time=2,
-        # )
-        # self.play(
-        #     UpdateFromFunc(group, lambda m: update(m, 1000)),
-        #     run_time=2,
-        # )
+        play_simulation(0, run_time=10)
+        play_simulation(10, run_time=10)
+        play_simulation(100, run_time=2)
+        play_simulation(1000, run_time=2)
+        # over a million experiments per second of video
+        play_simulation(100_000, run_time=4)
         self.wait()
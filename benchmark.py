@@ -0,0 +1,181 @@
+"""Benchmarks every Scene in topic.py and the 3B1B tutorials.
+
+Each scene is rendered at low quality with a fixed seed in its own process,
+so peak memory and caches do not leak between scenes. Results are written to
+a JSON file that can serve as the baseline of a later run:
+
+    python benchmark.py --output media/benchmark.json
+    python benchmark.py --compare media/benchmark.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from manim import tempconfig
+
+from helpers.scenes import ROOT, discover_scenes, load_scene
+
+# metrics compared against the baseline, and whether lower values are better
+METRICS = {
+    "construct_s": True,
+    "mean_play_s": True,
+    "fps": False,
+    "peak_rss_mb": True,
+}
+
+
+def run_scene(scene_id, seed):
+    """Renders one scene in this process and returns its measurements."""
+    cls = load_scene(scene_id)
+    random.seed(seed)
+    np.random.seed(seed)  # noqa: NPY002
+
+    with (
+        tempfile.TemporaryDirectory() as media_dir,
+        tempconfig(
+            {
+                "quality": "low_quality",
+                "media_dir": media_dir,
+                "disable_caching": True,
+                "progress_bar": "none",
+                "verbosity": "WARNING",
+            }
+        ),
+    ):
+        scene = cls()
+        if hasattr(scene, "seed"):
+            scene.seed = seed
+
+        play_times = []
+        n_frames = 0
+        play = scene.play
+        add_frame = scene.renderer.add_frame
+
+        def timed_play(*args, **kwargs):
+            start = time.perf_counter()
+            play(*args, **kwargs)
+            play_times.append(time.perf_counter() - start)
+
+        def counted_add_frame(frame, num_frames=1):
+            nonlocal n_frames
+            n_frames += num_frames
+            add_frame(frame, num_frames)
+
+        # scene.wait goes through scene.play, so it is timed as well
+        scene.play = timed_play
+        scene.renderer.add_frame = counted_add_frame
+
+        start = time.perf_counter()
+        scene.render()
+        construct_s = time.perf_counter() - start
+
+    return {
+        "construct_s": construct_s,
+        "n_plays": len(play_times),
+        "mean_play_s": sum(play_times) / len(play_times) if play_times else 0.0,
+        "max_play_s": max(play_times, default=0.0),
+        "n_frames": n_frames,
+        "fps": n_frames / construct_s if construct_s else 0.0,
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def run_all(scene_ids, seed):
+    """Runs every scene in a fresh interpreter and collects the results."""
+    results = {}
+    for scene_id in scene_ids:
+        print(f"benchmarking {scene_id}", file=sys.stderr)  # noqa: T201
+        process = subprocess.run(  # noqa: S603
+            [sys.executable, __file__, "--run-one", scene_id, "--seed", str(seed)],
+            capture_output=True,
+            text=True,
+            check=False,
+            cwd=ROOT,
+        )
+        if process.returncode != 0:
+            results[scene_id] = {"error": process.stderr.strip().splitlines()[-1:]}
+            continue
+        results[scene_id] = json.loads(process.stdout.strip().splitlines()[-1])
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Prints a comparison table and returns the number of regressions."""
+    n_regressions = 0
+    print(  # noqa: T201
+        f"{'scene':<50} {'metric':<12} {'baseline':>10} {'current':>10} {'ratio':>7}"
+    )
+    for scene_id, current in results.items():
+        before = baseline.get(scene_id)
+        if before is None or "error" in before or "error" in current:
+            print(f"{scene_id:<50} {'n/a':<12}")  # noqa: T201
+            continue
+        for metric, lower_is_better in METRICS.items():
+            ratio = current[metric] / before[metric] if before[metric] else 1.0
+            worse = ratio if lower_is_better else 1 / ratio if ratio else float("inf")
+            flag = "  REGRESSION" if worse > threshold else ""
+            n_regressions += bool(flag)
+            print(  # noqa: T201
+                f"{scene_id:<50} {metric:<12} {before[metric]:>10.3f} "
+                f"{current[metric]:>10.3f} {ratio:>7.2f}{flag}"
+            )
+    return n_regressions
+
+
+def main():
+    """Parses the command line and runs the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenes", nargs="*", help="substrings of scene ids to run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=Path("media/benchmark.json"))
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="slowdown ratio reported as a regression",
+    )
+    parser.add_argument("--run-one", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(run_scene(args.run_one, args.seed)))  # noqa: T201
+        return
+
+    # read the baseline first, it may be the file this run overwrites
+    baseline = json.loads(args.compare.read_text())["scenes"] if args.compare else None
+    scene_ids = [
+        scene_id
+        for scene_id in discover_scenes()
+        if not args.scenes or any(pattern in scene_id for pattern in args.scenes)
+    ]
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "seed": args.seed,
+            "quality": "low_quality",
+        },
+        "scenes": run_all(scene_ids, args.seed),
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"wrote {args.output}", file=sys.stderr)  # noqa: T201
+
+    if baseline is not None and compare(report["scenes"], baseline, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
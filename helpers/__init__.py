@@ -0,0 +1 @@
+"""Shared helpers for the LDA visualization and the 3B1B tutorials."""
@@ -0,0 +1,103 @@
+"""Fields of many arrows drawn as a handful of mobjects."""
+
+import numpy as np
+from manim import (
+    BLUE,
+    DEFAULT_DOT_RADIUS,
+    DEFAULT_STROKE_WIDTH,
+    ORANGE,
+    ORIGIN,
+    OUT,
+    PINK,
+    YELLOW,
+    VGroup,
+    VMobject,
+)
+
+from helpers.geometry import line_curves
+from helpers.lod import circle_points, lod_segments
+
+DEFAULT_TIP_LENGTH = 0.2
+
+
+class ArrowField(VGroup):
+    """Arrows from a common start to many ends, each with a dot at its end.
+
+    All arrows are built in one vectorized pass. Shafts and tips share one
+    points buffer, of which the `shafts` and `tips` layers hold views, and
+    all dots are the `dots` layer, so the field is three mobjects whatever
+    the number of arrows. A colour gradient spans a whole layer instead of
+    every single arrow. Arrows of length zero are left out, their dots are
+    not.
+    """
+
+    def __init__(
+        self,
+        ends,
+        start=ORIGIN,
+        tip_length=DEFAULT_TIP_LENGTH,
+        stroke_color=(BLUE, PINK),
+        stroke_width=DEFAULT_STROKE_WIDTH,
+        tip_color=None,
+        dot_color=(ORANGE, YELLOW),
+        dot_radius=DEFAULT_DOT_RADIUS / 2,
+        opacity=0.8,
+        dot_opacity=0.75,
+        **kwargs,
+    ) -> None:
+        """Creates the field; tips have the first stroke colour by default."""
+        super().__init__(**kwargs)
+        stroke_color = list(stroke_color)
+        self.start = np.asarray(start, dtype=float)
+        self.tip_length = tip_length
+        self.dot_radius = dot_radius
+        self.dots = VMobject(
+            fill_color=list(dot_color), fill_opacity=dot_opacity, stroke_width=0
+        )
+        self.shafts = VMobject(
+            stroke_color=stroke_color,
+            stroke_width=stroke_width,
+            stroke_opacity=opacity,
+        )
+        self.tips = VMobject(
+            fill_color=tip_color or stroke_color[0],
+            fill_opacity=opacity,
+            stroke_width=0,
+        )
+        self.add(self.dots, self.shafts, self.tips)
+        self.set_ends(ends)
+
+    def set_ends(self, ends):
+        """Points the arrows at `ends`, an array of shape (n, 3)."""
+        self.ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+        vectors = self.ends - self.start
+        lengths = np.linalg.norm(vectors, axis=1)
+        ends = self.ends[lengths > 0]
+        n_arrows = len(ends)
+        units = vectors[lengths > 0] / lengths[lengths > 0, None]
+        normals = np.cross(OUT, units)
+        # arrows shorter than their tip are all tip, like in Line.add_tip
+        shaft_ends = ends - units * np.minimum(lengths[lengths > 0], self.tip_length)[
+            :, None
+        ]
+        tip_base = ends - units * self.tip_length
+        corners = np.stack(
+            [
+                ends,
+                tip_base + normals * self.tip_length / 2,
+                tip_base - normals * self.tip_length / 2,
+            ],
+            axis=1,
+        )
+        # one curve per shaft followed by three per tip
+        self.buffer = np.empty((4 * n_arrows, 4, 3))
+        self.buffer[:n_arrows] = line_curves(self.start, shaft_ends)
+        self.buffer[n_arrows:] = line_curves(
+            corners, np.roll(corners, -1, axis=1)
+        ).reshape(-1, 4, 3)
+        self.shafts.points = self.buffer[:n_arrows].reshape(-1, 3)
+        self.tips.points = self.buffer[n_arrows:].reshape(-1, 3)
+
+        circle = self.dot_radius * circle_points(int(lod_segments(self.dot_radius)))
+        self.dots.points = (self.ends[:, None] + circle).reshape(-1, 3)
+        return self
@@ -0,0 +1,239 @@
+"""Registry of the icons in this repository and their pre-parsed bundle.
+
+Icons are looked up by name in the `icons/` directory. All of them are parsed
+once into a bundle of packed point and style arrays, which is memory mapped,
+so loading an icon copies a few arrays instead of parsing XML. The bundle is
+rebuilt incrementally, only re-parsing icons whose content changed:
+
+    python -m helpers.assets
+"""
+
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # windows, where the bundle is built without a lock
+    fcntl = None
+
+import numpy as np
+from manim import SVGMobject, VGroup, VMobject
+
+ICONS_DIR = Path(__file__).resolve().parents[1] / "icons"
+BUNDLE_DIR = ICONS_DIR / ".bundle"
+
+
+def icon_path(name):
+    """Returns the path of an icon, given its name such as "cross"."""
+    path = ICONS_DIR / f"{name.removesuffix('.svg')}.svg"
+    if not path.exists():
+        msg = f"no icon named {name!r} in {ICONS_DIR}"
+        raise FileNotFoundError(msg)
+    return path
+
+
+def parse_icon(path):
+    """Parses an svg into its points, one row of styles per path and path lengths.
+
+    A style row holds the fill rgba, the stroke rgba and the stroke width.
+    """
+    paths = SVGMobject(str(path)).family_members_with_points()
+    points = np.concatenate([m.points for m in paths])
+    styles = np.array(
+        [
+            [*m.get_fill_rgbas()[0], *m.get_stroke_rgbas()[0], m.get_stroke_width()]
+            for m in paths
+        ]
+    )
+    return points, styles, [len(m.points) for m in paths]
+
+
+def _read_index(bundle_dir):
+    index_file = bundle_dir / "index.json"
+    return json.loads(index_file.read_text()) if index_file.exists() else None
+
+
+def _stat(path):
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _up_to_date(icons_dir, bundle_dir):
+    index = _read_index(bundle_dir)
+    if index is None:
+        return False
+    icons = index["icons"]
+    paths = sorted(icons_dir.glob("*.svg"))
+    return [p.stem for p in paths] == list(icons) and all(
+        _stat(p) == (icons[p.stem]["mtime"], icons[p.stem]["size"]) for p in paths
+    )
+
+
+@contextlib.contextmanager
+def _locked(bundle_dir):
+    """Holds an exclusive lock on the bundle, so one process builds it at a time."""
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    with (bundle_dir / ".lock").open("w") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+def _save(path, array):
+    # written next to the target and renamed, so no reader sees a partial file
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with temporary.open("wb") as file:
+        np.save(file, array)
+    temporary.replace(path)
+
+
+def build_bundle(icons_dir=ICONS_DIR, bundle_dir=BUNDLE_DIR):
+    """Brings the bundle up to date and returns the names of re-parsed icons.
+
+    Icons whose modification time and size are unchanged are not even read;
+    the others are hashed and only parsed again if their sha256 changed. An
+    up to date bundle is checked without locking; otherwise processes build
+    it one at a time, and the ones waiting find it built.
+    """
+    if _up_to_date(icons_dir, bundle_dir):
+        return []
+    with _locked(bundle_dir):
+        return _build_bundle(icons_dir, bundle_dir)
+
+
+def _build_bundle(icons_dir, bundle_dir):
+    index = _read_index(bundle_dir)
+    old_icons = index["icons"] if index else {}
+    old = IconBundle(bundle_dir) if index else None
+
+    icons = {}
+    point_chunks, style_chunks = [], []
+    n_points = n_styles = 0
+    parsed = []
+    for path in sorted(icons_dir.glob("*.svg")):
+        mtime, size = _stat(path)
+        entry = old_icons.get(path.stem)
+        if entry and (entry["mtime"], entry["size"]) == (mtime, size):
+            sha256 = entry["sha256"]
+        else:
+            sha256 = hashlib.sha256(path.read_bytes()).hexdigest()
+        if entry and entry["sha256"] == sha256:
+            points, styles, lengths = old.arrays(path.stem)
+        else:
+            points, styles, lengths = parse_icon(path)
+            parsed.append(path.stem)
+        icons[path.stem] = {
+            "sha256": sha256,
+            "mtime": mtime,
+            "size": size,
+            "start": n_points,
+            "style_start": n_styles,
+            "lengths": lengths,
+        }
+        point_chunks.append(points)
+        style_chunks.append(styles)
+        n_points += len(points)
+        n_styles += len(styles)
+
+    if icons == old_icons:
+        return parsed
+
+    # arrays are named after their content and never rewritten in place, so
+    # when only modification times changed just the index is replaced, and
+    # processes that mapped the old arrays keep valid files
+    token = hashlib.sha256(
+        json.dumps({name: e["sha256"] for name, e in icons.items()}).encode()
+    ).hexdigest()[:16]
+    index = {
+        "icons": icons,
+        "points": f"points-{token}.npy",
+        "styles": f"styles-{token}.npy",
+    }
+    if not (bundle_dir / index["points"]).exists():
+        _save(
+            bundle_dir / index["points"],
+            np.concatenate([np.zeros((0, 3)), *point_chunks]),
+        )
+    if not (bundle_dir / index["styles"]).exists():
+        _save(
+            bundle_dir / index["styles"],
+            np.concatenate([np.zeros((0, 9)), *style_chunks]),
+        )
+    temporary = bundle_dir / f".index.json.{os.getpid()}.tmp"
+    temporary.write_text(json.dumps(index, indent=1))
+    temporary.replace(bundle_dir / "index.json")
+    for stale in bundle_dir.glob("*.npy"):
+        if stale.name not in [index["points"], index["styles"]]:
+            # still mapped by another process on some platforms
+            with contextlib.suppress(OSError):
+                stale.unlink()
+    return parsed
+
+
+class IconBundle:
+    """Read-only view of a bundle, with its arrays memory mapped."""
+
+    def __init__(self, bundle_dir=BUNDLE_DIR) -> None:
+        """Opens the bundle in `bundle_dir`."""
+        index = _read_index(bundle_dir)
+        if index is None:
+            msg = f"no icon bundle in {bundle_dir}, build it with build_bundle()"
+            raise FileNotFoundError(msg)
+        self.icons = index["icons"]
+        self.points = np.load(bundle_dir / index["points"], mmap_mode="r")
+        self.styles = np.load(bundle_dir / index["styles"], mmap_mode="r")
+
+    def __contains__(self, name) -> bool:
+        """Returns whether the bundle has an icon named `name`."""
+        return name in self.icons
+
+    def arrays(self, name):
+        """Returns the points, styles and path lengths of an icon."""
+        entry = self.icons[name]
+        lengths = entry["lengths"]
+        start, style_start = entry["start"], entry["style_start"]
+        return (
+            self.points[start : start + sum(lengths)],
+            self.styles[style_start : style_start + len(lengths)],
+            lengths,
+        )
+
+    def load(self, name):
+        """Builds an icon as a VGroup of paths, like an SVGMobject of its svg."""
+        points, styles, lengths = self.arrays(name)
+        icon = VGroup()
+        for chunk, style in zip(
+            np.split(points, np.cumsum(lengths)[:-1]), styles, strict=True
+        ):
+            path = VMobject()
+            path.points = np.array(chunk)
+            path.fill_rgbas = np.array([style[:4]])
+            path.stroke_rgbas = np.array([style[4:8]])
+            path.stroke_width = float(style[8])
+            icon.add(path)
+        return icon
+
+
+@functools.cache
+def icon_bundle():
+    """Returns the bundle of all icons, bringing it up to date once per process."""
+    build_bundle()
+    return IconBundle()
+
+
+def main():
+    """Builds or updates the icon bundle."""
+    parsed = build_bundle()
+    print(  # noqa: T201
+        f"parsed {len(parsed)} icons: {', '.join(parsed)}" if parsed else "up to date",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Streaming counts of binomial experiments for histogram animations."""
+
+import numpy as np
+
+
+class BinomialAccumulator:
+    """Counts the number of successes of repeated binomial experiments.
+
+    Every experiment consists of `n_trials` Bernoulli trials with success
+    probability `p`. Experiments are drawn in chunks of at most `chunk_size`
+    with a single binomial draw each and counted with `np.bincount`, so
+    millions of experiments per frame cost a few milliseconds and bounded
+    memory. `counts[k]` is the number of experiments with `k` successes.
+    """
+
+    def __init__(self, n_trials=10, p=0.2, chunk_size=1 << 20, rng=None) -> None:
+        """Creates an accumulator without any experiments."""
+        if not 0 <= p <= 1:
+            msg = f"p must be a probability, got {p}"
+            raise ValueError(msg)
+        self.n_trials = n_trials
+        self.p = p
+        self.chunk_size = chunk_size
+        self.rng = np.random.default_rng(rng)
+        self.counts = np.zeros(n_trials + 1, dtype=np.int64)
+
+    @property
+    def total(self):
+        """The number of experiments counted so far."""
+        return int(self.counts.sum())
+
+    def draw(self, n_experiments, rng=None):
+        """Returns the counts of `n_experiments` new experiments, without adding them.
+
+        They are drawn from `rng`, by default the accumulator's own generator.
+        """
+        rng = self.rng if rng is None else rng
+        counts = np.zeros_like(self.counts)
+        while n_experiments > 0:
+            size = min(n_experiments, self.chunk_size)
+            successes = rng.binomial(self.n_trials, self.p, size=size)
+            counts += np.bincount(successes, minlength=self.n_trials + 1)
+            n_experiments -= size
+        return counts
+
+    def add(self, n_experiments):
+        """Draws `n_experiments` experiments and adds them to the counts."""
+        self.counts += self.draw(n_experiments)
+        return self
+
+    def add_outcome(self, successes):
+        """Counts an experiment drawn elsewhere, such as one shown on screen."""
+        self.counts[successes] += 1
+        return self
+
+    def proportions(self):
+        """Returns the fraction of experiments per number of successes."""
+        return proportions(self.counts)
+
+
+def proportions(counts):
+    """Returns counts as fractions of their total, or zeros without any counts."""
+    total = counts.sum()
+    if total == 0:
+        return np.zeros(len(counts))
+    return counts / total
@@ -0,0 +1,30 @@
+"""Dashed lines that are moved around without dashing them again."""
+
+from manim import DashedLine
+
+
+class AnchoredDashedLine(DashedLine):
+    """DashedLine that is repositioned by shifting its dashes.
+
+    The dashes are computed once. The line keeps the offset from the first
+    point of its first dash to its anchor, the center by default, so finding
+    where the anchor is costs a lookup instead of a bounding box over every
+    dash, and moving the line is a single shift.
+    """
+
+    def __init__(self, *args, anchor=None, **kwargs) -> None:
+        """Creates the line; `anchor` is a point on it, by default its center."""
+        super().__init__(*args, **kwargs)
+        anchor = self.get_center() if anchor is None else anchor
+        self.anchor_offset = anchor - self._first_point()
+
+    def _first_point(self):
+        return self.submobjects[0].points[0]
+
+    def get_anchor(self):
+        """Returns the current position of the anchor."""
+        return self._first_point() + self.anchor_offset
+
+    def move_anchor_to(self, point):
+        """Moves the line so that its anchor is at `point`."""
+        return self.shift(point - self.get_anchor())
@@ -0,0 +1,106 @@
+"""Scrolling pane of document rows for long corpora."""
+
+from manim import (
+    DL,
+    DOWN,
+    DR,
+    GRAY,
+    RIGHT,
+    UL,
+    Group,
+    Integer,
+    Tex,
+    VectorizedPoint,
+    VGroup,
+    config,
+)
+
+from helpers.freeze import freeze
+
+# gap around the number of hidden documents in the summary line
+SUMMARY_BUFF = 0.05
+
+
+class DocumentPane:
+    """Keeps at most `max_rows` lines of documents in a scene.
+
+    Rows are stacked from the top left corner. Once the pane is full, the
+    oldest row is removed from the scene and all scrolled-out rows are
+    collapsed into a single summary line, so the number of live mobjects does
+    not grow with the number of documents. Everything that belongs to a row,
+    like the word tokens written into it, has to be added to the row so it
+    scrolls and disappears together with it. With `freeze_rows`, a row is
+    frozen into a single image once the next one is started, so only the
+    row that is being written is drawn as vector mobjects. The summary is
+    compiled once; scrolling only changes the number in it.
+    """
+
+    def __init__(self, scene, max_rows=5, buff=0.1, freeze_rows=True) -> None:
+        """Creates an empty pane drawing into `scene`."""
+        if max_rows < 2:
+            msg = f"max_rows must leave room for the summary and a row, got {max_rows}"
+            raise ValueError(msg)
+        self.scene = scene
+        self.max_rows = max_rows
+        self.buff = buff
+        self.freeze_rows = freeze_rows
+        self.rows = []
+        self.n_hidden = 0
+        self.summary = None
+
+    def new_row(self, label):
+        """Starts a new row below the last one, scrolling if the pane is full."""
+        if self.freeze_rows and self.rows:
+            self.rows[-1] = self.freeze_row(self.rows[-1])
+        row = VGroup(Tex(label))
+        self.rows.append(row)
+        # the summary takes up a line once rows have been scrolled out
+        while len(self.rows) + (self.n_hidden > 0) > self.max_rows:
+            self.collapse_oldest()
+        self.layout()
+        return row
+
+    def freeze_row(self, row):
+        """Replaces a finished row by an image, keeping the corner of its label."""
+        # the corner stands in for the label when rows are laid out
+        frozen = Group(VectorizedPoint(row[0].get_corner(UL)))
+        image = freeze(self.scene, row)
+        if image is not None:
+            frozen.add(image)
+        return frozen
+
+    def collapse_oldest(self):
+        """Removes the oldest row from the scene and folds it into the summary."""
+        row = self.rows.pop(0)
+        self.scene.remove(*row.get_family())
+        self.n_hidden += 1
+        if self.summary is None:
+            self.summary = Tex("doc 1: \\dots", color=GRAY)
+            self.scene.add(self.summary)
+            return
+        if self.n_hidden == 2:
+            self.scene.remove(self.summary)
+            self.hidden_count = Integer(2, color=GRAY)
+            self.summary = VGroup(
+                Tex("docs 1--", color=GRAY),
+                self.hidden_count,
+                Tex(": \\dots", color=GRAY),
+            )
+            self.scene.add(self.summary)
+        else:
+            self.hidden_count.set_value(self.n_hidden)
+        self.summary.arrange(RIGHT, buff=SUMMARY_BUFF, aligned_edge=DOWN)
+
+    def layout(self):
+        """Stacks the summary and the visible rows from the top left corner."""
+        corner = config.left_side + config.top + self.buff * DR
+        above = None
+        for line in [self.summary, *self.rows]:
+            if line is None:
+                continue
+            if above is not None:
+                corner = above.get_corner(DL) + self.buff * DOWN
+            # rows are aligned by their label, like a row that was just started
+            anchor = line if line is self.summary else line[0]
+            line.shift(corner - anchor.get_corner(UL))
+            above = line
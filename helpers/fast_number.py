@@ -0,0 +1,134 @@
+"""Numbers drawn from a prebuilt atlas of digit glyphs."""
+
+import functools
+
+import numpy as np
+from manim import (
+    DEFAULT_FONT_SIZE,
+    ORIGIN,
+    WHITE,
+    MathTex,
+    VectorizedPoint,
+    VGroup,
+    VMobject,
+)
+
+from helpers.geometry import parallelogram_points
+
+GLYPHS = "0123456789."
+
+# horizontal gap between glyphs per unit of font size, as in DecimalNumber
+DIGIT_BUFF_PER_FONT_UNIT = 0.001
+
+
+@functools.cache
+def glyph_atlas():
+    """Returns the points of every glyph at the default font size.
+
+    The points of each glyph are shifted so the lower left corner of its
+    bounding box is the origin; the tex is compiled only once per process.
+    """
+    tex = MathTex(*GLYPHS)
+    atlas = {}
+    for char, glyph in zip(GLYPHS, tex, strict=True):
+        points = np.concatenate([m.points for m in glyph.family_members_with_points()])
+        atlas[char] = points - points.min(axis=0)
+    return atlas
+
+
+class GlyphNumber(VGroup):
+    """A non-negative decimal number with a fixed number of glyph slots.
+
+    Setting the value copies glyph points from `glyph_atlas` into the slots,
+    so it neither compiles tex nor creates mobjects. The layout is tracked by
+    three invisible corner points, which follow every shift, scale or
+    rotation, and the bounding box does not change with the value, so the
+    number does not jitter next to other mobjects. Integer digits are right
+    aligned and leading zeros are left blank.
+    """
+
+    def __init__(
+        self,
+        number=0,
+        num_decimal_places=2,
+        n_integer_digits=1,
+        font_size=DEFAULT_FONT_SIZE,
+        color=WHITE,
+        **kwargs,
+    ) -> None:
+        """Creates the slots and shows `number`."""
+        super().__init__(**kwargs)
+        self.num_decimal_places = num_decimal_places
+        self.n_integer_digits = n_integer_digits
+
+        atlas = glyph_atlas()
+        self.glyph_widths = {char: np.ptp(atlas[char][:, 0]) for char in GLYPHS}
+        digit_width = max(self.glyph_widths[char] for char in GLYPHS[:-1])
+        buff = DIGIT_BUFF_PER_FONT_UNIT * DEFAULT_FONT_SIZE
+        self.slot_chars = n_integer_digits * "0"
+        if num_decimal_places > 0:
+            self.slot_chars += "." + num_decimal_places * "0"
+        # every slot is as wide as its widest glyph, glyphs are centred in it
+        advances = [
+            self.glyph_widths["."] if char == "." else digit_width
+            for char in self.slot_chars
+        ]
+        self.slot_lefts = np.cumsum([0, *(a + buff for a in advances[:-1])])
+        self.slot_widths = np.array(advances)
+        self.box = np.array(
+            [
+                self.slot_lefts[-1] + advances[-1],
+                max(np.ptp(atlas[char][:, 1]) for char in GLYPHS),
+            ]
+        )
+
+        self.frame = VGroup(
+            VectorizedPoint([0, 0, 0]),
+            VectorizedPoint([self.box[0], 0, 0]),
+            VectorizedPoint([0, self.box[1], 0]),
+        )
+        self.slots = VGroup(
+            *(
+                VMobject(fill_color=color, fill_opacity=1.0, stroke_width=0)
+                for _ in self.slot_chars
+            )
+        )
+        self.add(self.slots, self.frame)
+        self.set_value(number)
+        self.scale(font_size / DEFAULT_FONT_SIZE)
+        self.move_to(ORIGIN)
+
+    def format(self, number):
+        """Returns the glyph of every slot for `number`, with blanks as spaces."""
+        text = f"{number:.{self.num_decimal_places}f}"
+        n_integer = len(text.partition(".")[0])
+        if number < 0 or n_integer > self.n_integer_digits:
+            msg = f"{number} does not fit into {self.n_integer_digits} integer digits"
+            raise ValueError(msg)
+        return (self.n_integer_digits - n_integer) * " " + text
+
+    def get_value(self):
+        """Returns the number shown."""
+        return self.number
+
+    def set_value(self, number):
+        """Shows `number` by copying glyph points into the slots."""
+        atlas = glyph_atlas()
+        origin, x_end, y_end = (point.get_center() for point in self.frame)
+        for slot, char, left, width in zip(
+            self.slots,
+            self.format(number),
+            self.slot_lefts,
+            self.slot_widths,
+            strict=True,
+        ):
+            if char == " ":
+                slot.points = np.zeros((0, 3))
+                continue
+            glyph = atlas[char]
+            x = glyph[:, 0] + left + (width - self.glyph_widths[char]) / 2
+            slot.points = parallelogram_points(
+                origin, x_end, y_end, x / self.box[0], glyph[:, 1] / self.box[1]
+            )
+        self.number = number
+        return self
@@ -0,0 +1,66 @@
+"""Snapshots of finished, static mobjects as single images."""
+
+import numpy as np
+from manim import DL, UR, Camera, ImageMobject, config
+
+
+def rasterize(mobjects, margin=0.05):
+    """Draws mobjects into an image mobject covering their bounding box.
+
+    The image is rendered at the resolution of the current config and its
+    pixels are aligned with the pixels of the scene, so it looks the same as
+    the vector mobjects as long as it is not scaled. `margin` leaves room for
+    strokes, which stick out of the bounding box.
+    """
+    pixels_per_unit = config.pixel_width / config.frame_width
+    # lower left corner of the scene, where its pixel grid starts
+    origin = np.array([-config.frame_width / 2, -config.frame_height / 2, 0])
+    corners = np.array([m.get_corner(DL) for m in mobjects])
+    low = np.floor((corners.min(axis=0) - margin - origin) * pixels_per_unit)
+    corners = np.array([m.get_corner(UR) for m in mobjects])
+    high = np.ceil((corners.max(axis=0) + margin - origin) * pixels_per_unit)
+    pixel_width, pixel_height = (high - low)[:2].astype(int)
+    width, height = pixel_width / pixels_per_unit, pixel_height / pixels_per_unit
+    center = origin + (low + high) / 2 / pixels_per_unit
+    center[2] = 0
+
+    camera = Camera(
+        pixel_width=pixel_width,
+        pixel_height=pixel_height,
+        frame_width=width,
+        frame_height=height,
+        frame_center=center,
+        background_opacity=0,
+    )
+    camera.capture_mobjects(mobjects)
+    # cairo leaves premultiplied colours, images are drawn with straight ones
+    pixels = camera.pixel_array.astype(float)
+    alpha = pixels[..., 3:]
+    np.divide(pixels[..., :3] * 255, alpha, out=pixels[..., :3], where=alpha > 0)
+    image = ImageMobject(np.clip(pixels, 0, 255).astype(np.uint8))
+    image.stretch_to_fit_width(width)
+    image.stretch_to_fit_height(height)
+    return image.move_to(center)
+
+
+def freeze(scene, mobject, margin=0.05):
+    """Replaces the parts of `mobject` shown in `scene` by a single image.
+
+    Only the family members that are currently in the scene are drawn, in
+    their order in the scene, and the image takes the place of the first of
+    them. Freezing pays off for groups that no longer change but stay on
+    screen, which would otherwise be rasterized again in every frame.
+    """
+    family = set(mobject.get_family())
+    shown = scene.get_mobject_family_members()
+    visible = [m for m in shown if m in family and len(m.points)]
+    if not visible:
+        return None
+    image = rasterize(visible, margin)
+    index = min(
+        (i for i, m in enumerate(scene.mobjects) if m in family),
+        default=len(scene.mobjects),
+    )
+    scene.remove(*family)
+    scene.mobjects.insert(min(index, len(scene.mobjects)), image)
+    return image
@@ -0,0 +1,26 @@
+"""Vectorized construction of Bezier control points."""
+
+import numpy as np
+
+THIRDS = np.linspace(0, 1, 4)[:, None]
+
+
+def line_curves(starts, ends):
+    """Returns the cubic Bezier control points of straight segments.
+
+    `starts` and `ends` have shape (..., 3); the result has shape (..., 4, 3).
+    """
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    return starts[..., None, :] + THIRDS * (ends - starts)[..., None, :]
+
+
+def parallelogram_points(origin, x_end, y_end, u, v):
+    """Maps (u, v) in the unit square onto the parallelogram spanned by three points.
+
+    This is how linear axes map coordinates to the scene, so every point of a
+    plot can be placed in a single vectorized step.
+    """
+    u = np.asarray(u, dtype=float)[..., None]
+    v = np.asarray(v, dtype=float)[..., None]
+    return origin + u * (x_end - origin) + v * (y_end - origin)
@@ -0,0 +1,93 @@
+"""Histogram whose bar heights live in a numpy array."""
+
+import numpy as np
+from manim import BLUE, VectorizedPoint, VGroup, VMobject
+
+from helpers.geometry import line_curves, parallelogram_points
+
+
+class ArrayHistogram(VGroup):
+    """Bars drawn against linear axes, with heights kept in a numpy array.
+
+    Bin `i` spans `[i, i + 1]` on the x-axis. All bars that share a colour are
+    drawn as a single VMobject, and updating the heights rewrites the points of
+    every bar in one vectorized operation, so histograms with thousands of bins
+    neither allocate new mobjects nor loop over their bars. `bar_colors` is a
+    single colour or a list with one colour per bar; a tuple of colours is a
+    gradient, which spans all bars of that colour.
+    """
+
+    def __init__(
+        self,
+        axes,
+        values,
+        bar_width=1.0,
+        bar_colors=BLUE,
+        fill_opacity=0.8,
+        stroke_width=1,
+        **kwargs,
+    ) -> None:
+        """Creates bars for `values` on `axes`."""
+        super().__init__(**kwargs)
+        self.values = np.array(values, dtype=float)
+        self.bar_width = bar_width
+
+        # three points spanning the axes, which move along with the bars
+        (x_min, x_max), (y_min, y_max) = axes.x_range[:2], axes.y_range[:2]
+        self.x_range = np.array([x_min, x_max], dtype=float)
+        self.y_range = np.array([y_min, y_max], dtype=float)
+        self.frame = VGroup(
+            VectorizedPoint(axes.c2p(x_min, y_min)),
+            VectorizedPoint(axes.c2p(x_max, y_min)),
+            VectorizedPoint(axes.c2p(x_min, y_max)),
+        )
+
+        if not isinstance(bar_colors, list):
+            bar_colors = len(self.values) * [bar_colors]
+        keys = [tuple(c) if isinstance(c, (list, tuple)) else (c,) for c in bar_colors]
+        self.layer_bins = []
+        self.layers = VGroup()
+        for key in dict.fromkeys(keys):
+            color = key[0] if len(key) == 1 else list(key)
+            self.layer_bins.append(np.flatnonzero([k == key for k in keys]))
+            self.layers.add(
+                VMobject(
+                    fill_color=color,
+                    fill_opacity=fill_opacity,
+                    stroke_color=color,
+                    stroke_width=stroke_width,
+                )
+            )
+        self.add(self.frame, self.layers)
+        self.change_bar_values(self.values)
+
+    def coords_to_points(self, x, y):
+        """Maps arrays of axes coordinates to scene points."""
+        origin, x_end, y_end = (point.get_center() for point in self.frame)
+        u = (np.asarray(x) - self.x_range[0]) / np.ptp(self.x_range)
+        v = (np.asarray(y) - self.y_range[0]) / np.ptp(self.y_range)
+        return parallelogram_points(origin, x_end, y_end, u, v)
+
+    def get_bar_top(self, index):
+        """Returns the top centre of a bar."""
+        return self.coords_to_points(index + 0.5, self.values[index])
+
+    def get_bar_bottom(self, index):
+        """Returns the bottom centre of a bar."""
+        return self.coords_to_points(index + 0.5, 0)
+
+    def change_bar_values(self, values):
+        """Sets the bar heights, rewriting the points of all bars in place."""
+        self.values[:] = values
+        left = np.arange(len(self.values)) + (1 - self.bar_width) / 2
+        right = left + self.bar_width
+        zeros = np.zeros_like(self.values)
+        # corners of every bar, counterclockwise from the bottom left
+        corners = self.coords_to_points(
+            np.stack([left, right, right, left], axis=1),
+            np.stack([zeros, zeros, self.values, self.values], axis=1),
+        )
+        curves = line_curves(corners, np.roll(corners, -1, axis=1))
+        for layer, bins in zip(self.layers, self.layer_bins, strict=True):
+            layer.points = curves[bins].reshape(-1, 3)
+        return self
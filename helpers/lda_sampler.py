@@ -0,0 +1,90 @@
+"""Vectorized sampler for the LDA generative process."""
+
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+
+class Corpus(NamedTuple):
+    """A sampled corpus of D documents with N tokens each.
+
+    Every topic has its own vocabulary of V words, so `words` holds indices
+    into the word distribution of the topic that generated the token.
+    """
+
+    topic_prob: np.ndarray  # (D, K) topic mixture per document
+    word_prob: np.ndarray  # (D, K, V) word distribution per document and topic
+    topics: np.ndarray  # (D, N) topic of every token
+    words: np.ndarray  # (D, N) word of every token, within its topic
+
+
+def _index_dtype(n):
+    """Returns the smallest unsigned integer dtype that can index `n` items."""
+    return np.min_scalar_type(max(n - 1, 0))
+
+
+def _sample_categorical(cumulative, rows, rng):
+    """Draws one category per entry of `rows` from the rows of `cumulative`.
+
+    Each row is shifted by its own index so a single `searchsorted` over the
+    flattened table samples all rows at once.
+    """
+    n_rows, n_categories = cumulative.shape
+    cumulative = cumulative.copy()
+    cumulative[:, -1] = 1.0
+    cumulative += np.arange(n_rows)[:, None]
+    u = rng.random(rows.shape) + rows
+    flat = np.searchsorted(cumulative.ravel(), u.ravel(), side="right")
+    categories = flat - rows.ravel() * n_categories
+    # rounding in the shifted table can push a draw just past its row
+    return np.clip(categories, 0, n_categories - 1).reshape(rows.shape)
+
+
+def sample_corpus(alphas_topics, alphas_words, n_documents, n_words, rng=None):
+    """Samples topic mixtures, topic assignments and words for a whole corpus.
+
+    `alphas_topics` has shape (K,) and `alphas_words` shape (K, V). Every
+    document draws its own topic mixture and word distributions, as in the
+    LDA scene. `rng` is a numpy `Generator` or a seed.
+    """
+    rng = np.random.default_rng(rng)
+    alphas_topics = np.asarray(alphas_topics, dtype=float)
+    alphas_words = np.asarray(alphas_words, dtype=float)
+    n_topics, n_vocabulary = alphas_words.shape
+    if alphas_topics.shape != (n_topics,):
+        msg = "alphas_topics and alphas_words disagree on the number of topics"
+        raise ValueError(msg)
+
+    topic_prob = rng.dirichlet(alphas_topics, size=n_documents)
+    # a Dirichlet draw is a normalized vector of Gamma draws
+    word_prob = rng.standard_gamma(
+        alphas_words, size=(n_documents, *alphas_words.shape)
+    )
+    word_prob /= word_prob.sum(axis=-1, keepdims=True)
+
+    documents = np.broadcast_to(np.arange(n_documents)[:, None], (n_documents, n_words))
+    topics = _sample_categorical(topic_prob.cumsum(axis=1), documents, rng)
+    words = _sample_categorical(
+        word_prob.cumsum(axis=2).reshape(-1, n_vocabulary),
+        documents * n_topics + topics,
+        rng,
+    )
+    return Corpus(
+        topic_prob=topic_prob,
+        word_prob=word_prob,
+        topics=topics.astype(_index_dtype(n_topics)),
+        words=words.astype(_index_dtype(n_vocabulary)),
+    )
+
+
+def save_corpus(path, corpus):
+    """Saves a sampled corpus to a compressed .npz trace."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(path, **corpus._asdict())
+
+
+def load_corpus(path):
+    """Loads a corpus saved with `save_corpus`."""
+    with np.load(path) as trace:
+        return Corpus(**{field: trace[field] for field in Corpus._fields})
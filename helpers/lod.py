@@ -0,0 +1,58 @@
+"""Level of detail for circles, from their size on screen."""
+
+import numpy as np
+from manim import config
+
+# largest deviation from the true circle, in pixels
+DEFAULT_TOLERANCE = 0.25
+MIN_SEGMENTS = 4
+MAX_SEGMENTS = 64
+
+
+def arc_error(angle):
+    """Returns the largest radial error of a unit arc drawn as one cubic curve.
+
+    This is the bound for handles of length 4/3 tan(angle / 4), which is how
+    manim draws arcs.
+    """
+    quarter = np.asarray(angle, dtype=float) / 4
+    return 4 / 27 * np.sin(quarter) ** 6 / np.cos(quarter) ** 2
+
+
+def lod_segments(radius, pixel_width=None, tolerance=DEFAULT_TOLERANCE):
+    """Returns the number of cubic curves needed to draw circles of `radius`.
+
+    The count is the smallest one that keeps the error below `tolerance`
+    pixels at the resolution of the render, so small circles and low quality
+    renders get fewer curves. `radius` may be an array.
+    """
+    if pixel_width is None:
+        pixel_width = config.pixel_width
+    radius_px = (
+        np.abs(np.asarray(radius, dtype=float)) * pixel_width / config.frame_width
+    )
+    with np.errstate(divide="ignore"):
+        relative = np.where(radius_px > 0, tolerance / radius_px, np.inf)
+    # invert the error bound without the cosine, then correct for it
+    ratio = np.clip((27 / 4 * relative) ** (1 / 6), 0, 1)
+    segments = np.ceil(2 * np.pi / (4 * np.arcsin(ratio))).astype(int)
+    segments += arc_error(2 * np.pi / segments) > relative
+    return np.clip(segments, MIN_SEGMENTS, MAX_SEGMENTS)
+
+
+def circle_points(n_segments):
+    """Returns the points of a unit circle drawn with `n_segments` cubic curves."""
+    angles = np.linspace(0, 2 * np.pi, n_segments + 1)
+    anchors = np.stack([np.cos(angles), np.sin(angles), np.zeros_like(angles)], 1)
+    tangents = np.stack([-anchors[:, 1], anchors[:, 0], np.zeros_like(angles)], 1)
+    handle = 4 / 3 * np.tan(np.pi / (2 * n_segments))
+    curves = np.stack(
+        [
+            anchors[:-1],
+            anchors[:-1] + handle * tangents[:-1],
+            anchors[1:] - handle * tangents[1:],
+            anchors[1:],
+        ],
+        axis=1,
+    )
+    return curves.reshape(-1, 3)
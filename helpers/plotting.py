@@ -0,0 +1,137 @@
+"""Plots built from one vectorized evaluation of their function."""
+
+import functools
+
+import numpy as np
+from manim import VMobject
+
+from helpers.geometry import line_curves, parallelogram_points
+
+DEFAULT_DX = 0.01
+DEFAULT_CACHE_SIZE = 32
+SNAP_DECIMALS = 12
+# relative difference of the limits from both sides of a removable point
+LIMIT_TOLERANCE = 1e-3
+# how much faster the function may change next to a removable point than a
+# sample further away, anything steeper is taken for a pole
+MAX_GROWTH = 1.5
+
+
+def axes_to_points(axes, xs, ys):
+    """Returns the scene points of coordinates on linear axes, like axes.c2p."""
+    origin = axes.c2p(0, 0)
+    return parallelogram_points(origin, axes.c2p(1, 0), axes.c2p(0, 1), xs, ys)
+
+
+def sample(func, xs):
+    """Evaluates `func` once on every sample, vectorized if it allows.
+
+    Samples where the function is undefined, e.g. divisions by zero, are nan.
+    """
+    xs = np.asarray(xs, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        try:
+            ys = np.broadcast_to(np.asarray(func(xs), dtype=float), xs.shape)
+        except (TypeError, ValueError):
+            ys = np.array([_scalar(func, x) for x in xs])
+    return np.where(np.isfinite(ys), ys, np.nan)
+
+
+def _scalar(func, x):
+    try:
+        return func(x)
+    except (ZeroDivisionError, ValueError):
+        return np.nan
+
+
+class Samples:
+    """Samples of a function `dx` apart on [x_min, x_max], with its gaps filled.
+
+    Samples are snapped to 12 decimals, so round values such as 0 are hit
+    exactly rather than next to them, where cancellation gives wrong values.
+    An undefined sample between three defined ones on either side is a
+    removable singularity if the function stays bounded towards it from both
+    sides and the limits from the left and the right agree; it gets that
+    limit and its x is listed in `removable`. Other undefined samples, such
+    as poles, stay nan. The last sample is `x_max` even if `dx` does not
+    divide the range.
+    """
+
+    def __init__(self, func, x_min, x_max, dx) -> None:
+        """Evaluates `func` on all samples in one call."""
+        n_segments = max(int(np.ceil((x_max - x_min) / dx - 1e-9)), 1)
+        xs = np.round(x_min + dx * np.arange(n_segments + 1), SNAP_DECIMALS)
+        xs[-1] = x_max
+        self.xs = xs
+        self.ys = sample(func, self.xs)
+        gaps = np.flatnonzero(np.isnan(self.ys))
+        gaps = gaps[(gaps >= 3) & (gaps < len(self.xs) - 3)]
+        # the three samples on either side, ordered away from the gap
+        before = [self.ys[gaps - i] for i in (1, 2, 3)]
+        after = [self.ys[gaps + i] for i in (1, 2, 3)]
+        # linear extrapolation from either side, and the cubic through the
+        # two nearest samples on both sides
+        left = 2 * before[0] - before[1]
+        right = 2 * after[0] - after[1]
+        limit = (4 * (before[0] + after[0]) - before[1] - after[1]) / 6
+        removable = (
+            _bounded(before, limit)
+            & _bounded(after, limit)
+            & np.isclose(left, right, rtol=LIMIT_TOLERANCE)
+        )
+        self.ys[gaps[removable]] = limit[removable]
+        self.removable = self.xs[gaps[removable]]
+        self.defined = ~np.isnan(self.ys)
+
+    def value_at(self, x):
+        """Interpolates the function at `x`, which may be an array."""
+        return np.interp(x, self.xs, self.ys)
+
+
+def _bounded(side, limit):
+    # next to a pole the steps between samples grow quickly towards it
+    near = np.abs(side[0] - side[1])
+    far = np.abs(side[1] - side[2])
+    return near <= MAX_GROWTH * far + LIMIT_TOLERANCE * (1 + np.abs(limit))
+
+
+@functools.lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def sampled(func, x_min, x_max, dx):
+    """Returns the samples of `func`, shared by every plot of the same range."""
+    return Samples(func, x_min, x_max, dx)
+
+
+class SampledGraph(VMobject):
+    """Graph of a function on linear axes, like axes.plot, as one polyline.
+
+    The function is evaluated once per sample for all plots of the same
+    function, range and `dx`, so it should take numpy arrays; functions that
+    do not are called once per sample. Segments touching undefined samples,
+    or starting less than `dx` from a point in `exclude`, are left out,
+    which leaves holes in the line. Removable singularities are drawn
+    through. `value_at` and `point_at` interpolate the samples instead of
+    calling the function again.
+    """
+
+    def __init__(
+        self, axes, func, x_range, dx=DEFAULT_DX, exclude=(), **kwargs
+    ) -> None:
+        """Plots `func` over `x_range`, a pair [x_min, x_max]."""
+        super().__init__(**kwargs)
+        self.axes = axes
+        self.underlying_function = func
+        self.samples = sampled(func, float(x_range[0]), float(x_range[1]), dx)
+        xs, ys = self.samples.xs, self.samples.ys
+        keep = self.samples.defined[:-1] & self.samples.defined[1:]
+        for x in exclude:
+            keep &= np.abs(xs[:-1] - x) >= dx
+        points = axes_to_points(axes, xs, np.nan_to_num(ys))
+        self.points = line_curves(points[:-1], points[1:])[keep].reshape(-1, 3)
+
+    def value_at(self, x):
+        """Returns the function at `x`, or its limit there if it is removable."""
+        return self.samples.value_at(x)
+
+    def point_at(self, x):
+        """Returns the point of the graph above `x`."""
+        return axes_to_points(self.axes, x, self.value_at(x))
@@ -0,0 +1,89 @@
+"""Simulations that run ahead of the animation in a background thread."""
+
+import contextlib
+import queue
+import threading
+
+DEFAULT_MAX_SNAPSHOTS = 4
+# seconds between checks for a stop or an error while waiting on the queue
+POLL_INTERVAL = 0.1
+
+
+class SimulationProducer:
+    """Calls a simulation step in a worker thread, a few steps ahead of the frames.
+
+    `step` is called over and over and returns a snapshot, which must not be
+    changed afterwards, e.g. the counts of new experiments. It must not change
+    anything the frames read either, since the snapshots still queued when
+    the producer stops are dropped. Snapshots go into a bounded queue and
+    the worker blocks while it is full, so it runs at most
+    `max_snapshots` steps ahead of the renderer and is idle otherwise instead
+    of competing with it for the GIL. Every frame takes the next snapshot in
+    order, so the results are the same as stepping once per frame; the gain
+    is that numpy releases the GIL in much of its work, so large steps run
+    next to the rasterization of the frames. Steps that are pure Python gain
+    nothing from this and are better left in the frame updater.
+    """
+
+    def __init__(self, step, max_snapshots=DEFAULT_MAX_SNAPSHOTS) -> None:
+        """Creates a stopped producer; use it as a context manager to run it."""
+        self.step = step
+        self.n_steps = 0
+        self._queue = queue.Queue(maxsize=max_snapshots)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._error = None
+
+    def __enter__(self) -> "SimulationProducer":
+        """Starts the worker thread."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stops the worker thread."""
+        self.stop()
+
+    def _run(self):
+        try:
+            while not self._stopped.is_set():
+                snapshot = self.step()
+                self.n_steps += 1
+                while not self._stopped.is_set():
+                    try:
+                        self._queue.put(snapshot, timeout=POLL_INTERVAL)
+                        break
+                    except queue.Full:
+                        pass
+        except Exception as error:  # noqa: BLE001
+            # raised again in the rendering thread by `next_snapshot`
+            self._error = error
+
+    def next_snapshot(self):
+        """Returns the next snapshot, waiting for it if the worker is behind."""
+        while True:
+            try:
+                return self._queue.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                if self._error is not None:
+                    raise self._error from None
+
+    def stop(self):
+        """Stops the simulation and waits for the current step to finish."""
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+
+@contextlib.contextmanager
+def snapshots(step, background=False):
+    """Yields a function returning the snapshot to show in the next frame.
+
+    Without `background`, that is `step` itself, so the simulation advances
+    one step per frame in the frame updater; with it, `step` runs ahead in a
+    `SimulationProducer`, still one step per frame.
+    """
+    if not background:
+        yield step
+        return
+    with SimulationProducer(step) as producer:
+        yield producer.next_snapshot
@@ -0,0 +1,186 @@
+"""Opt-in per-play profiling of scenes, written as a Chrome trace.
+
+The trace opens as a timeline or flame graph in Perfetto, speedscope or
+chrome://tracing:
+
+    python -m helpers.profiling topic.py:TopicGenerationSimulation -o trace.json
+"""
+
+import argparse
+import functools
+import json
+import time
+from pathlib import Path
+
+from manim import SVGMobject, tempconfig
+
+from helpers.scenes import load_scene
+
+# phases timed inside every play call
+PHASES = ["update", "rasterize", "encode", "svg_parse"]
+
+
+class PlayProfiler:
+    """Records wall time, frames, scene size and phase times of every play call.
+
+    "update" is the time spent interpolating animations and running updaters,
+    which covers UpdateFromFunc and always_redraw. "rasterize" is the camera
+    drawing the mobjects, "encode" is writing frames to the movie and
+    "svg_parse" is building SVG based mobjects, including Tex.
+    """
+
+    def __init__(self, scene, per_frame_events=True) -> None:
+        """Instruments `scene`; call `close` to undo the class-level hooks."""
+        self.scene = scene
+        self.per_frame_events = per_frame_events
+        self.events = []
+        self.plays = []
+        self._origin = time.perf_counter()
+        self._current = None
+
+        renderer = scene.renderer
+        self._wrap_instance(scene, "play", self._timed_play)
+        self._wrap_instance(scene, "update_to_time", self._phase("update"))
+        self._wrap_instance(renderer, "add_frame", self._counted_add_frame)
+        self._wrap_instance(
+            renderer.camera, "capture_mobjects", self._phase("rasterize")
+        )
+        self._wrap_instance(renderer.file_writer, "write_frame", self._phase("encode"))
+        # every Tex and SVGMobject goes through SVGMobject.__init__
+        self._svg_init = SVGMobject.__init__
+        SVGMobject.__init__ = self._phase("svg_parse")(self._svg_init)
+
+    def close(self):
+        """Removes the class-level hooks."""
+        SVGMobject.__init__ = self._svg_init
+
+    def _now(self):
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def _event(self, name, start, end, category, args=None):
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start,
+            "dur": end - start,
+            "pid": 0,
+            "tid": 0,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def _wrap_instance(self, obj, name, wrapper):
+        setattr(obj, name, wrapper(getattr(obj, name)))
+
+    def _phase(self, phase):
+        def wrapper(function):
+            @functools.wraps(function)
+            def timed(*args, **kwargs):
+                start = self._now()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    end = self._now()
+                    if self._current is not None:
+                        self._current[f"{phase}_s"] += (end - start) / 1e6
+                    if self.per_frame_events:
+                        self._event(phase, start, end, "phase")
+
+            return timed
+
+        return wrapper
+
+    def _counted_add_frame(self, add_frame):
+        @functools.wraps(add_frame)
+        def counted(frame, num_frames=1):
+            if self._current is not None:
+                self._current["frames"] += num_frames
+            return add_frame(frame, num_frames)
+
+        return counted
+
+    def _timed_play(self, play):
+        @functools.wraps(play)
+        def timed(*args, **kwargs):
+            # nested plays, if any, are accounted to the outer one
+            if self._current is not None:
+                return play(*args, **kwargs)
+            self._current = {f"{phase}_s": 0.0 for phase in PHASES}
+            self._current["frames"] = 0
+            start = self._now()
+            try:
+                return play(*args, **kwargs)
+            finally:
+                end = self._now()
+                stats = self._current
+                self._current = None
+                family = self.scene.get_mobject_family_members()
+                animations = getattr(self.scene, "animations", None) or []
+                stats.update(
+                    index=len(self.plays),
+                    animations=[type(a).__name__ for a in animations],
+                    wall_s=(end - start) / 1e6,
+                    mobjects=len(family),
+                    points=sum(len(m.points) for m in family),
+                )
+                self.plays.append(stats)
+                name = ", ".join(stats["animations"]) or "play"
+                self._event(f"play {stats['index']}: {name}", start, end, "play", stats)
+
+        return timed
+
+    def render(self):
+        """Renders the scene, recording the whole render as the root event."""
+        start = self._now()
+        try:
+            self.scene.render()
+        finally:
+            self._event("render", start, self._now(), "render")
+
+    def save(self, path):
+        """Writes the recorded events as a Chrome trace file."""
+        trace = {"traceEvents": self.events, "displayTimeUnit": "ms"}
+        Path(path).write_text(json.dumps(trace))
+
+
+def profile_scene(cls, output, per_frame_events=True):
+    """Renders a Scene class with profiling and writes the trace to `output`."""
+    profiler = PlayProfiler(cls(), per_frame_events=per_frame_events)
+    try:
+        profiler.render()
+    finally:
+        profiler.close()
+        profiler.save(output)
+    return profiler
+
+
+def main():
+    """Parses the command line and profiles a single scene."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scene", help='scene id such as "topic.py:Scene"')
+    parser.add_argument("-o", "--output", default="trace.json")
+    parser.add_argument("-q", "--quality", default="low_quality")
+    parser.add_argument(
+        "--no-frames",
+        action="store_true",
+        help="only record play calls, not the phases of every frame",
+    )
+    args = parser.parse_args()
+    with tempconfig({"quality": args.quality}):
+        profiler = profile_scene(
+            load_scene(args.scene), args.output, per_frame_events=not args.no_frames
+        )
+    for stats in profiler.plays:
+        print(  # noqa: T201
+            f"play {stats['index']:>4} {stats['wall_s']:8.3f}s "
+            f"{stats['frames']:>5} frames {stats['mobjects']:>6} mobjects "
+            f"{stats['points']:>8} points  update {stats['update_s']:.3f}s "
+            f"rasterize {stats['rasterize_s']:.3f}s encode {stats['encode_s']:.3f}s "
+            f"svg {stats['svg_parse_s']:.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""always_redraw that only rebuilds when its declared inputs change."""
+
+from collections import OrderedDict
+
+import numpy as np
+from manim import ValueTracker
+
+DEFAULT_MAX_SIZE = 16
+
+# values closer than this are the same frame, e.g. on the way back of
+# there_and_back, which recomputes the values of the way there with rounding
+DECIMALS = 9
+
+
+def input_value(source):
+    """Returns a hashable snapshot of a redraw input."""
+    if isinstance(source, ValueTracker):
+        return round(source.get_value(), DECIMALS)
+    if isinstance(source, np.ndarray):
+        return source.tobytes()
+    if callable(source):
+        return source()
+    msg = f"redraw inputs are ValueTrackers, arrays or callables, got {source!r}"
+    raise TypeError(msg)
+
+
+class RedrawCache:
+    """Memoizes the mobjects built by a function on the values of its inputs.
+
+    A frame in which no input changed costs a comparison of the input values.
+    Otherwise the mobject is taken from a small LRU cache of earlier builds
+    if the same values were seen before, and built by calling the function
+    only if they were not. `hits` counts the frames that did not call the
+    function and `misses` the ones that did.
+    """
+
+    def __init__(self, func, inputs, max_size=DEFAULT_MAX_SIZE) -> None:
+        """Creates an empty cache for `func`, keyed on the values of `inputs`."""
+        self.func = func
+        self.inputs = inputs
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.key = None
+        self._built = OrderedDict()
+
+    def current_key(self):
+        """Returns the values of all inputs."""
+        return tuple(input_value(source) for source in self.inputs)
+
+    def get(self, key):
+        """Returns the mobject built for `key`, building it if needed."""
+        built = self._built.get(key)
+        if built is None:
+            self.misses += 1
+            built = self.func()
+            self._built[key] = built
+            if len(self._built) > self.max_size:
+                self._built.popitem(last=False)
+        else:
+            self.hits += 1
+            self._built.move_to_end(key)
+        return built
+
+    def update(self, mobject):
+        """Updater turning `mobject` into the build for the current inputs."""
+        key = self.current_key()
+        if key == self.key:
+            self.hits += 1
+            return
+        # become aligns the points of both mobjects, so the cached build is
+        # only ever used through a copy
+        mobject.become(self.get(key).copy())
+        self.key = key
+
+
+def cached_redraw(func, *inputs, max_size=DEFAULT_MAX_SIZE):
+    """Like always_redraw, but `func` is only called when `inputs` change.
+
+    `inputs` are ValueTrackers, numpy arrays, which may be changed in place,
+    or callables returning a hashable value. Everything else `func` depends on
+    has to stay constant. The cache, with its hit and miss counters, is the
+    `redraw_cache` attribute of the returned mobject.
+    """
+    cache = RedrawCache(func, inputs, max_size=max_size)
+    cache.key = cache.current_key()
+    mobject = cache.get(cache.key).copy()
+    mobject.redraw_cache = cache
+    mobject.add_updater(cache.update)
+    return mobject
@@ -0,0 +1,49 @@
+"""Discovery of the scene files and Scene classes in this repository."""
+
+import importlib.util
+import inspect
+import sys
+from pathlib import Path
+
+from manim import Scene
+
+ROOT = Path(__file__).resolve().parents[1]
+SCENE_FILES = [
+    ROOT / "topic.py",
+    *sorted((ROOT / "3B1B-Animated-Tutorials").glob("*.py")),
+]
+
+
+def load_module(path):
+    """Imports a scene file the way the manim command line does."""
+    path = Path(path).resolve()
+    sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[path.stem] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_scene_classes(module):
+    """Returns the Scene classes defined in a module, by name."""
+    return {
+        name: cls
+        for name, cls in inspect.getmembers(module, inspect.isclass)
+        if issubclass(cls, Scene) and cls.__module__ == module.__name__
+    }
+
+
+def discover_scenes():
+    """Returns the ids ("file.py:SceneName") of all scenes in the scene files."""
+    return [
+        f"{path.relative_to(ROOT)}:{name}"
+        for path in SCENE_FILES
+        for name in get_scene_classes(load_module(path))
+    ]
+
+
+def load_scene(scene_id):
+    """Returns the Scene class of a scene id."""
+    path, name = scene_id.rsplit(":", 1)
+    return getattr(load_module(ROOT / path), name)
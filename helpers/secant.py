@@ -0,0 +1,122 @@
+"""Secant slope group that follows its trackers without being rebuilt."""
+
+import numpy as np
+from manim import (
+    DEFAULT_DOT_RADIUS,
+    DOWN,
+    GREEN,
+    RIGHT,
+    UP,
+    YELLOW,
+    Dot,
+    Line,
+    MathTex,
+    VGroup,
+)
+
+from helpers.plotting import axes_to_points, sample
+
+
+class SecantSlopeGroup(VGroup):
+    """Like axes.get_secant_slope_group, with dots on both points of the graph.
+
+    Its mobjects and labels are built once. An updater reads the `x` and `dx`
+    ValueTrackers, evaluates the function once for both points and moves the
+    lines with put_start_and_end_on, the dots with move_to and the labels by
+    rescaling a copy of their points, so nothing is created per frame and
+    frames where neither tracker changed cost a comparison.
+    """
+
+    def __init__(
+        self,
+        axes,
+        graph,
+        x,
+        dx,
+        dx_line_color=YELLOW,
+        dy_line_color=None,
+        dx_label=None,
+        dy_label=None,
+        secant_line_color=GREEN,
+        secant_line_length=10,
+        dot_radius=DEFAULT_DOT_RADIUS,
+        **kwargs,
+    ) -> None:
+        """Creates the group for the trackers `x` and `dx` and starts following them."""
+        super().__init__(**kwargs)
+        self.axes = axes
+        self.graph = graph
+        self.x = x
+        self.dx = dx
+        self.secant_line_length = secant_line_length
+        self.dot1 = Dot(radius=dot_radius)
+        self.dot2 = Dot(radius=dot_radius)
+        self.dx_line = Line(color=dx_line_color)
+        self.df_line = Line(color=dy_line_color or graph.get_color())
+        self.secant_line = Line(color=secant_line_color)
+        self.add(self.dot1, self.dot2, self.dx_line, self.df_line)
+        self.labels = VGroup()
+        self.dx_label = self.df_label = None
+        if dx_label is not None:
+            self.dx_label = MathTex(dx_label).set_color(self.dx_line.get_color())
+            self.labels.add(self.dx_label)
+        if dy_label is not None:
+            self.df_label = MathTex(dy_label).set_color(self.df_line.get_color())
+            self.labels.add(self.df_label)
+        self.add(*self.labels, self.secant_line)
+        # the labels at their full size, centered on the origin
+        self.label_templates = VGroup(*[label.copy().center() for label in self.labels])
+        self.key = None
+        self.update_secant()
+        self.add_updater(lambda m: m.update_secant())
+
+    def update_secant(self):
+        """Moves everything to the current values of the trackers."""
+        key = (self.x.get_value(), self.dx.get_value())
+        if key == self.key:
+            return self
+        self.key = key
+        x, dx = key
+        ys = sample(self.graph.underlying_function, [x, x + dx])
+        p1, p2 = axes_to_points(self.axes, [x, x + dx], ys)
+        interim_point = p2[0] * RIGHT + p1[1] * UP
+        self.dot1.move_to(p1)
+        self.dot2.move_to(p2)
+        self.dx_line.put_start_and_end_on(p1, interim_point)
+        self.df_line.put_start_and_end_on(interim_point, p2)
+        if np.any(p1 != p2):
+            direction = (p2 - p1) / np.linalg.norm(p2 - p1)
+            middle = (p1 + p2) / 2
+            self.secant_line.put_start_and_end_on(
+                middle - direction * self.secant_line_length / 2,
+                middle + direction * self.secant_line_length / 2,
+            )
+        self.update_labels(np.sign(dx))
+        return self
+
+    def update_labels(self, sign):
+        """Sizes the labels to fit the lines and puts them next to them."""
+        if not len(self.labels):
+            return
+        # the labels shrink together when the lines get too short for them
+        templates = self.label_templates
+        scale = min(
+            1,
+            0.8 * self.dx_line.width / templates.width,
+            0.8 * self.df_line.height / templates.height,
+        )
+        for label, template in zip(self.labels, self.label_templates, strict=True):
+            for mobject, original in zip(
+                label.family_members_with_points(),
+                template.family_members_with_points(),
+                strict=True,
+            ):
+                mobject.points = scale * original.points
+        if self.dx_label is not None:
+            self.dx_label.next_to(
+                self.dx_line, sign * DOWN, buff=self.dx_label.height / 2
+            )
+        if self.df_label is not None:
+            self.df_label.next_to(
+                self.df_line, sign * RIGHT, buff=self.df_label.height / 2
+            )
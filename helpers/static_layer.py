@@ -0,0 +1,93 @@
+"""Pre-rasterized background layer for mobjects that never move."""
+
+import numpy as np
+from manim import Camera, Scene
+
+
+def fingerprint(mobjects):
+    """Returns a cheap summary of the geometry and style of mobjects.
+
+    It changes whenever a mobject is moved, reshaped or recoloured, which is
+    all that is needed to notice that a rasterized copy went stale.
+    """
+    summary = []
+    for mobject in mobjects:
+        for mob in mobject.get_family():
+            summary.append(len(mob.points))
+            summary.extend(mob.points.sum(axis=0))
+            for attr in ["fill_rgbas", "stroke_rgbas", "stroke_width"]:
+                value = getattr(mob, attr, None)
+                if value is not None:
+                    summary.append(float(np.sum(value)))
+    return tuple(summary)
+
+
+class StaticLayerCamera(Camera):
+    """Camera that draws its static mobjects into the background once.
+
+    The rasterized layer is cached per resolution and is redrawn only when
+    the fingerprint of the static mobjects changes.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Creates a camera without static mobjects."""
+        self.static_mobjects = []
+        self._layers = {}
+        super().__init__(*args, **kwargs)
+
+    def init_background(self):
+        """Creates the plain background the static layer is drawn onto."""
+        super().init_background()
+        self.plain_background = self.background
+
+    def reset(self):
+        """Starts a frame from the static layer instead of the plain background."""
+        self.background = self.get_static_layer()
+        return super().reset()
+
+    def get_static_layer(self):
+        """Returns the background with the static mobjects drawn on it."""
+        if not self.static_mobjects:
+            return self.plain_background
+        key = (self.pixel_height, self.pixel_width)
+        summary = fingerprint(self.static_mobjects)
+        cached = self._layers.get(key)
+        if cached is None or cached[0] != summary:
+            self.set_pixel_array(self.plain_background)
+            self.capture_mobjects(self.static_mobjects)
+            cached = (summary, self.pixel_array.copy())
+            self._layers[key] = cached
+        return cached[1]
+
+
+class StaticLayerScene(Scene):
+    """Scene whose static mobjects are rasterized once and composited below.
+
+    Mobjects passed to `add_static` are not part of `self.mobjects`, so they
+    cannot be animated; they always sit below everything else. With a camera
+    that has no static layer, such as the OpenGL one, they are added normally.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        """Creates the scene with a `StaticLayerCamera`."""
+        kwargs.setdefault("camera_class", StaticLayerCamera)
+        super().__init__(**kwargs)
+
+    def add_static(self, *mobjects):
+        """Adds mobjects to the pre-rasterized background layer."""
+        camera = getattr(self.renderer, "camera", None)
+        if isinstance(camera, StaticLayerCamera):
+            camera.static_mobjects.extend(mobjects)
+        else:
+            self.add(*mobjects)
+        return self
+
+    def remove_static(self, *mobjects):
+        """Removes mobjects from the pre-rasterized background layer."""
+        camera = getattr(self.renderer, "camera", None)
+        if isinstance(camera, StaticLayerCamera):
+            for mobject in mobjects:
+                camera.static_mobjects.remove(mobject)
+        else:
+            self.remove(*mobjects)
+        return self
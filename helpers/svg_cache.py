@@ -0,0 +1,112 @@
+"""Process-wide cache of parsed SVG templates."""
+
+from collections import OrderedDict
+from pathlib import Path
+
+from manim import SVGMobject
+
+from helpers.assets import ICONS_DIR, icon_bundle
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def fix_svg(svgmobject):
+    """Fixes missing attributes when loading svg."""
+    attrs = [
+        "fill_rgbas",
+        "stroke_rgbas",
+        "background_stroke_rgbas",
+        "stroke_width",
+        "background_stroke_width",
+        "sheen_direction",
+        "sheen_factor",
+    ]
+    for attr in attrs:
+        if getattr(svgmobject, attr) is None:
+            setattr(svgmobject, attr, 0)
+
+
+def mobject_nbytes(mobject):
+    """Returns the memory held by the point and colour arrays of a mobject."""
+    attrs = ["points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"]
+    return sum(
+        getattr(getattr(mob, attr, None), "nbytes", 0)
+        for mob in mobject.get_family()
+        for attr in attrs
+    )
+
+
+class SVGTemplateCache:
+    """LRU cache of parsed SVG templates, bounded by their memory footprint.
+
+    Every template is parsed and passed through `fix_svg` exactly once; callers
+    get a copy, so they are free to move, scale and recolour what they receive.
+    Icons of this repository are loaded from the pre-parsed icon bundle.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES) -> None:
+        """Creates an empty cache holding at most `max_bytes` of templates."""
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._templates = OrderedDict()
+
+    def __len__(self) -> int:
+        """Returns the number of cached templates."""
+        return len(self._templates)
+
+    def get(self, path, height=None, width=None):
+        """Returns a copy of the template for `path` at the given size."""
+        key = (str(Path(path).resolve()), height, width)
+        entry = self._templates.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = self._load(path, height, width)
+            self._templates[key] = entry
+            self.nbytes += entry[1]
+            self._evict()
+        else:
+            self.hits += 1
+            self._templates.move_to_end(key)
+        return entry[0].copy()
+
+    def clear(self):
+        """Drops all cached templates."""
+        self._templates.clear()
+        self.nbytes = 0
+
+    def _load(self, path, height, width):
+        path = Path(path).resolve()
+        if path.parent == ICONS_DIR and path.stem in icon_bundle():
+            # sized and centred the way SVGMobject does it
+            template = icon_bundle().load(path.stem).center()
+            if height is not None:
+                template.set(height=height)
+            if width is not None:
+                template.set(width=width)
+            return template, mobject_nbytes(template)
+        # only forward the sizes that were asked for, so SVGMobject keeps its
+        # own default height otherwise
+        kwargs = {}
+        if height is not None:
+            kwargs["height"] = height
+        if width is not None:
+            kwargs["width"] = width
+        template = SVGMobject(str(path), **kwargs)
+        fix_svg(template)
+        return template, mobject_nbytes(template)
+
+    def _evict(self):
+        # always keep the most recent template, even if it alone is too large
+        while self.nbytes > self.max_bytes and len(self._templates) > 1:
+            _, (_, nbytes) = self._templates.popitem(last=False)
+            self.nbytes -= nbytes
+
+
+svg_cache = SVGTemplateCache()
+
+
+def load_svg(path, height=None, width=None):
+    """Loads an svg through the process-wide template cache."""
+    return svg_cache.get(path, height=height, width=width)
@@ -0,0 +1,172 @@
+"""Compiles every Tex and MathTex of the scenes in parallel before rendering.
+
+Strings are collected statically from the Tex, MathTex and SingleStringMathTex
+calls with literal arguments in the scene files, from the literal labels
+passed to methods that build MathTex themselves, such as get_axis_labels,
+from the `tex_strings` classmethod of scenes that build their tex from data,
+and from the glyphs of numbers on axes and counters. They are compiled into
+manim's tex cache by a pool of processes, so a later render finds the SVGs
+and only parses them:
+
+    python -m helpers.tex_prewarm -j 8
+"""
+
+import argparse
+import ast
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from manim import MathTex, SingleStringMathTex, Tex, config, tempconfig
+
+from helpers.scenes import SCENE_FILES, get_scene_classes, load_module
+
+TEX_CLASSES = {cls.__name__: cls for cls in [Tex, MathTex, SingleStringMathTex]}
+
+# keyword arguments that change the compiled tex, others only style the result
+TEX_KEYWORDS = ["arg_separator", "tex_environment", "substrings_to_isolate"]
+
+# calls that build a MathTex of some of their arguments, with the parameters
+# in positional order as (name, default); None marks parameters without tex
+LABEL_PARAMETERS = {
+    "get_axis_labels": [("x_label", "x"), ("y_label", "y")],
+    "get_x_axis_label": [("label", None)],
+    "get_y_axis_label": [("label", None)],
+    "get_secant_slope_group": [
+        *5 * [(None, None)],
+        ("dx_label", None),
+        ("dy_label", None),
+    ],
+    "SecantSlopeGroup": [*6 * [(None, None)], ("dx_label", None), ("dy_label", None)],
+}
+
+# glyphs that DecimalNumber and Integer compile one by one, e.g. on axes
+NUMBER_GLYPHS = [*"0123456789.-", "\\%"]
+
+
+def _hashable(value):
+    """Turns literal lists, such as substrings to isolate, into tuples."""
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _literal(node):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return None
+
+
+def scan_labels(name, node):
+    """Returns the MathTex labels of a call in LABEL_PARAMETERS with literal labels."""
+    parameters = LABEL_PARAMETERS[name]
+    labels = {
+        parameter: default for parameter, default in parameters if parameter is not None
+    }
+    for (parameter, _), arg in zip(parameters, node.args, strict=False):
+        if parameter is not None:
+            labels[parameter] = _literal(arg)
+    for keyword in node.keywords:
+        if keyword.arg in labels:
+            labels[keyword.arg] = _literal(keyword.value)
+    return [
+        ("MathTex", (label,), ()) for label in labels.values() if isinstance(label, str)
+    ]
+
+
+def scan_file(path):
+    """Returns the (class name, args, kwargs) of tex calls with literal arguments."""
+    found = []
+    for node in ast.walk(ast.parse(path.read_text(), filename=str(path))):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+        if name in LABEL_PARAMETERS:
+            found.extend(scan_labels(name, node))
+            continue
+        if name not in TEX_CLASSES or not node.args:
+            continue
+        try:
+            args = tuple(ast.literal_eval(arg) for arg in node.args)
+            kwargs = tuple(
+                (keyword.arg, _hashable(ast.literal_eval(keyword.value)))
+                for keyword in node.keywords
+                if keyword.arg in TEX_KEYWORDS
+            )
+        except ValueError:
+            # built from variables or f-strings, left to `tex_strings`
+            continue
+        if all(isinstance(arg, str) for arg in args):
+            found.append((name, args, kwargs))
+    return found
+
+
+def collect_tex(paths=SCENE_FILES):
+    """Returns every distinct tex call the scenes in `paths` are known to make."""
+    found = [("MathTex", (glyph,), ()) for glyph in NUMBER_GLYPHS]
+    # the glyph atlas of GlyphNumber
+    found.append(("MathTex", tuple("0123456789."), ()))
+    for path in paths:
+        found.extend(scan_file(path))
+        for cls in get_scene_classes(load_module(path)).values():
+            if hasattr(cls, "tex_strings"):
+                found.extend(
+                    (tex_class.__name__, tuple(args), ())
+                    for tex_class, args in cls.tex_strings()
+                )
+    return list(dict.fromkeys(found))
+
+
+def build(name, args, kwargs):
+    """Builds a tex mobject, compiling it into the tex cache if needed."""
+    return TEX_CLASSES[name](*args, **dict(kwargs))
+
+
+def _compile(item, tex_dir):
+    """Compiles a single tex call in a worker process and returns its duration."""
+    start = time.perf_counter()
+    with tempconfig({"tex_dir": tex_dir, "verbosity": "WARNING"}):
+        build(*item)
+    return time.perf_counter() - start
+
+
+def prewarm(items, jobs=None):
+    """Compiles `items` in parallel and returns the compile time of each.
+
+    Only the SVGs in the tex cache are kept; each render parses them itself.
+    """
+    tex_dir = config.get_dir("tex_dir")
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return dict(
+            zip(items, pool.map(_compile, items, [tex_dir] * len(items)), strict=True)
+        )
+
+
+def main():
+    """Parses the command line and compiles the tex of all scenes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--list", action="store_true", help="only print the collected tex"
+    )
+    args = parser.parse_args()
+
+    items = collect_tex()
+    if args.list:
+        for name, tex_args, _ in items:
+            print(f"{name}{tex_args}")  # noqa: T201
+        return
+
+    start = time.perf_counter()
+    durations = prewarm(items, jobs=args.jobs)
+    slowest = max(durations.values(), default=0.0)
+    print(  # noqa: T201
+        f"compiled {len(items)} tex strings in {time.perf_counter() - start:.2f}s, "
+        f"slowest {slowest:.2f}s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
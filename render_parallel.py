@@ -0,0 +1,125 @@
+"""Renders TopicGenerationSimulation as per-document segments in parallel.
+
+Every document is rendered by its own process from the same recorded trace.
+A segment starts from the reconstructed layout of the documents before it,
+so the segments can be concatenated losslessly into the full video.
+
+    python render_parallel.py --trace media/lda_trace.npz -q low_quality
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from manim import tempconfig
+
+from helpers.assets import build_bundle
+from helpers.scenes import ROOT
+from helpers.tex_prewarm import collect_tex, prewarm
+from topic import TopicGenerationSimulation
+
+QUALITIES = [
+    "low_quality",
+    "medium_quality",
+    "high_quality",
+    "production_quality",
+    "fourk_quality",
+]
+
+
+def render_segment(trace_file, doc_index, quality):
+    """Renders a single document and returns the path of its movie."""
+    name = f"{TopicGenerationSimulation.__name__}_doc{doc_index + 1}"
+    options = {
+        "quality": quality,
+        "output_file": name,
+        # segments must not share a partial movie directory, or their cache
+        # clean-ups would delete each other's files
+        "partial_movie_dir": (
+            "{media_dir}/videos/{module_name}/{quality}/partial_movie_files/" + name
+        ),
+    }
+    with tempconfig(options):
+        scene = TopicGenerationSimulation()
+        scene.trace_file = trace_file
+        scene.documents = str(doc_index + 1)
+        scene.render()
+        return Path(scene.renderer.file_writer.movie_file_path)
+
+
+def concatenate(movies, output):
+    """Joins movies with identical encodings without re-encoding them."""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for movie in movies:
+            listing.write(f"file '{movie.resolve()}'\n")
+    try:
+        subprocess.run(  # noqa: S603
+            [
+                shutil.which("ffmpeg") or "ffmpeg",
+                "-y",
+                "-loglevel",
+                "error",
+                "-f",
+                "concat",
+                "-safe",
+                "0",
+                "-i",
+                listing.name,
+                "-c",
+                "copy",
+                str(output),
+            ],
+            check=True,
+        )
+    finally:
+        Path(listing.name).unlink()
+
+
+def main():
+    """Parses the command line and renders all documents in parallel."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--trace",
+        default="media/lda_trace.npz",
+        help="trace to replay; it is sampled and recorded first if missing",
+    )
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="high_quality")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("media/videos/topic/TopicGenerationSimulation.mp4"),
+    )
+    args = parser.parse_args()
+
+    # every segment has to replay the same samples
+    with tempconfig({"quality": args.quality}):
+        scene = TopicGenerationSimulation()
+        scene.trace_file = args.trace
+        n_documents = len(scene.sample().topics)
+        # the segments would all compile the same tex into manim's tex cache
+        # at once, which is not safe, and all parse the icons on a fresh clone
+        prewarm(collect_tex([ROOT / "topic.py"]), jobs=args.jobs)
+    build_bundle()
+
+    with ProcessPoolExecutor(max_workers=min(args.jobs, n_documents)) as pool:
+        movies = list(
+            pool.map(
+                render_segment,
+                [args.trace] * n_documents,
+                range(n_documents),
+                [args.quality] * n_documents,
+            )
+        )
+    concatenate(movies, args.output)
+    print(f"Rendered {n_documents} documents to {args.output}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
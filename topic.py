@@ -1,25 +1,16 @@
-from itertools import product
-from scipy.stats import dirichlet, multinomial
+import os
+from pathlib import Path
 
 from manim import *
 
-probabilities = {0: [0.4, 0.6], 1: [0.3, 0.7], 2: [0.6, 0.4]}
-labels = np.array(["food", "animals"])
+from helpers.assets import icon_path
+from helpers.document_pane import DocumentPane
+from helpers.histogram import ArrayHistogram
+from helpers.lda_sampler import load_corpus, sample_corpus, save_corpus
+from helpers.static_layer import StaticLayerScene
+from helpers.svg_cache import load_svg
 
-word_probabilities = {
-    0: {
-        labels[0]: [0.2, 0.1, 0.3, 0.15, 0.25],
-        labels[1]: [0.1, 0.15, 0.3, 0.25, 0.2],
-    },
-    1: {
-        labels[0]: [0.15, 0.05, 0.35, 0.25, 0.2],
-        labels[1]: [0.1, 0.25, 0.1, 0.3, 0.25],
-    },
-    2: {
-        labels[0]: [0.1, 0.15, 0.3, 0.25, 0.2],
-        labels[1]: [0.2, 0.1, 0.3, 0.15, 0.25],
-    },
-}
+labels = np.array(["food", "animals"])
 
 
 words = [
@@ -36,48 +27,47 @@ words = [
 ]
 
 
-def add_svg_xticks(bar_chart):
-    """Adds svg symbols instead of standard x-ticks to a BarChart."""
+def add_svg_xticks(histogram):
+    """Adds svg symbols instead of standard x-ticks to a histogram."""
     for i, word in enumerate(words):
         symbol = create_word_token(word)
-        symbol.next_to(bar_chart[0][i], DOWN, buff=0.3, aligned_edge=DOWN)
-        bar_chart.add(symbol)
+        symbol.next_to(
+            histogram.bars.get_bar_bottom(i), DOWN, buff=0.3, aligned_edge=DOWN
+        )
+        histogram.add(symbol)
 
 
-def create_histogram(probabilities, labels, **kwargs):
+def create_histogram(probabilities, labels, y_range, bar_colors):
     """Creates a histogram with probabilities and labels."""
-    return BarChart(
-        values=probabilities,
-        bar_names=labels,
-        y_axis_config={"font_size": 36},
-        x_axis_config={"font_size": 36},
-        y_length=4,
+    axes = Axes(
+        x_range=[0, len(probabilities), 1],
+        y_range=y_range,
         x_length=5,
-        **kwargs,
+        y_length=4,
+        tips=False,
+        y_axis_config={"font_size": 36, "include_numbers": True},
     )
-
-
-def fix_svg(svgmobject):
-    """Fixes missing attributes when loading svg."""
-    attrs = [
-        "fill_rgbas",
-        "stroke_rgbas",
-        "background_stroke_rgbas",
-        "stroke_width",
-        "background_stroke_width",
-        "sheen_direction",
-        "sheen_factor",
-    ]
-    for attr in attrs:
-        if getattr(svgmobject, attr) is None:
-            setattr(svgmobject, attr, 0)
+    bars = ArrayHistogram(
+        axes,
+        probabilities,
+        bar_width=0.6,
+        bar_colors=bar_colors,
+        fill_opacity=0.7,
+        stroke_width=3,
+    )
+    histogram = VGroup(axes, bars)
+    histogram.bars = bars
+    if labels is not None:
+        for i, label in enumerate(labels):
+            histogram.add(
+                Tex(label, font_size=36).next_to(bars.get_bar_bottom(i), DOWN)
+            )
+    return histogram
 
 
 def create_word_token(word):
     """Creates a word token."""
-    symbol = SVGMobject(f"icons/{word}.svg", height=0.4)
-    fix_svg(symbol)
-    return symbol
+    return load_svg(icon_path(word), height=0.4)
 
 
 def create_topic_symbol(row, value):
@@ -91,200 +81,246 @@ def create_topic_symbol(row, value):
     return symbol
 
 
-class TopicGenerationSimulation(Scene):
+ANIMATION_LEVELS = ["full", "per-document", "summary"]
+
+
+def parse_documents(spec, n_documents):
+    """Parses a 1-based, inclusive document range such as "2" or "2-3"."""
+    if not spec:
+        return 0, n_documents
+    first, _, last = str(spec).partition("-")
+    first, last = int(first), int(last or first)
+    if not 1 <= first <= last <= n_documents:
+        msg = f"documents {spec!r} are not within the {n_documents} of the trace"
+        raise ValueError(msg)
+    return first - 1, last
+
+
+class TopicGenerationSimulation(StaticLayerScene):
     alphas_topics = [10, 20]
     alphas_words_topic1 = [5, 10, 8, 3, 10]
     alphas_words_topic2 = [10, 3, 8, 9, 5]
+    n_documents = 3
+    n_words = 5
+    # rows shown at once; older documents are collapsed into a summary line
+    max_rows = 5
+    seed = None
+    # replay the samples stored in this .npz trace, or record them to it
+    trace_file = os.environ.get("LDA_TRACE")
+    # only animate these documents, e.g. "2" or "2-3"; earlier ones are filled in
+    documents = os.environ.get("LDA_DOCUMENTS")
+    # "full" animates every draw, "per-document" fuses the words of a document
+    # into one play and "summary" only animates the bars
+    animation_level = os.environ.get("LDA_ANIMATION", "full")
 
-    def construct(self):
+    @classmethod
+    def tex_strings(cls) -> list:
+        """Returns the Tex built from data, for `helpers.tex_prewarm`."""
+        tex = [(Tex, (label,)) for label in labels]
+        tex += [(Tex, (f"doc {n}: ",)) for n in range(1, cls.n_documents + 1)]
+        # the summary line of the rows scrolled out of the document pane, whose
+        # number of documents is an Integer
+        tex += [(Tex, ("doc 1: \\dots",)), (Tex, ("docs 1--",)), (Tex, (": \\dots",))]
+        return tex
+
+    def sample(self):
+        """Samples the topics and words of every document in one pass."""
+        if self.trace_file and Path(self.trace_file).exists():
+            return load_corpus(self.trace_file)
+        corpus = sample_corpus(
+            self.alphas_topics,
+            [self.alphas_words_topic1, self.alphas_words_topic2],
+            n_documents=self.n_documents,
+            n_words=self.n_words,
+            rng=self.seed,
+        )
+        if self.trace_file:
+            save_corpus(self.trace_file, corpus)
+        return corpus
+
+    def setup_layout(self):
+        """Creates the histograms and arrows."""
         # create empty histograms
-        topic_distribution = create_histogram([0, 0.0], labels, y_range=[0, 0.8, 0.2])
-        word_distribution = create_histogram(
+        self.topic_distribution = create_histogram(
+            [0, 0.0], labels, y_range=[0, 0.8, 0.2], bar_colors=["#003f5c", "#58508d"]
+        )
+        self.word_distribution = create_histogram(
             10 * [0],
             labels=None,
             bar_colors=5 * ["#003f5c"] + 5 * ["#ffa600"],
             y_range=(0, 0.5, 0.1),
         )
-        add_svg_xticks(word_distribution)
+        add_svg_xticks(self.word_distribution)
 
         # create arrows
-        arrow_topic = Line(ORIGIN, DOWN * 0.8).add_tip().set_color(BLUE)
-        arrow_word = Line(ORIGIN, DOWN * 0.8).add_tip().set_color(BLUE)
+        self.arrow_topic = Line(ORIGIN, DOWN * 0.8).add_tip().set_color(BLUE)
+        self.arrow_word = Line(ORIGIN, DOWN * 0.8).add_tip().set_color(BLUE)
 
         # align objects
-        topic_distribution.to_edge(DOWN + LEFT)
-        word_distribution.to_edge(DOWN + RIGHT)
-        word_distribution.move_to(topic_distribution, UP, UP)
-
-        row = VGroup(Tex(r"doc 1:"))
-        row.to_edge(UP + LEFT, buff=0.1)
-
-        # initialize view
-        self.add(topic_distribution, word_distribution, row)
-        # self.add(topic_distribution, word_distribution)
-        # return
-        # animate
-        # for doc in range(5):
-        # draw probabilities
-
-        for doc_index in range(3):
-            topic_prob = dirichlet(self.alphas_topics).rvs(1)[0]
-            word_prob = np.concatenate(
-                [
-                    dirichlet(self.alphas_words_topic1).rvs(1)[0],
-                    dirichlet(self.alphas_words_topic2).rvs(1)[0],
-                ],
+        self.topic_distribution.to_edge(DOWN + LEFT)
+        self.word_distribution.to_edge(DOWN + RIGHT)
+        self.word_distribution.move_to(self.topic_distribution, UP, UP)
+
+        self.pane = DocumentPane(self, max_rows=self.max_rows)
+        # only the bars move; the axes, labels and tick icons are drawn once
+        for histogram in [self.topic_distribution, self.word_distribution]:
+            self.add_static(*[m for m in histogram if m is not histogram.bars])
+            self.add(histogram.bars)
+
+    def new_row(self, doc_index):
+        """Starts the row of a new document below the previous one."""
+        return self.pane.new_row(f"doc {doc_index + 1}: ")
+
+    def token(self, corpus, doc_index, word_index):
+        """Returns the topic and the word index in the histogram of a token."""
+        n_vocabulary = corpus.word_prob.shape[-1]
+        topic = int(corpus.topics[doc_index, word_index])
+        word = int(corpus.words[doc_index, word_index]) + n_vocabulary * topic
+        return topic, word
+
+    def write_row(self, corpus, doc_index):
+        """Writes the words of a document into a new row without animating it."""
+        row = self.new_row(doc_index)
+        self.add(row[0])
+        for word_index in range(corpus.topics.shape[1]):
+            topic, word = self.token(corpus, doc_index, word_index)
+            topic_symbol = create_topic_symbol(row, topic)
+            word_symbol = create_word_token(words[word])
+            row.add(word_symbol.move_to(topic_symbol.get_center()))
+            self.add(word_symbol)
+        return topic, word
+
+    def fill_document(self, corpus, doc_index):
+        """Puts a document in its final state without animating it."""
+        topic, word = self.write_row(corpus, doc_index)
+        self.topic_distribution.bars.change_bar_values(corpus.topic_prob[doc_index])
+        self.word_distribution.bars.change_bar_values(
+            corpus.word_prob[doc_index].ravel()
+        )
+        if self.animation_level == "full":
+            self.arrow_topic.next_to(
+                self.topic_distribution.bars.get_bar_top(topic), UP, buff=0.1
             )
-            if doc_index > 0:
-                self.play(FadeOut(arrow_topic), FadeOut(arrow_word))
-            self.play(topic_distribution.animate.change_bar_values(topic_prob))
-            self.play(word_distribution.animate.change_bar_values(word_prob))
-            # else:
-            #     topic_distribution.change_bar_values(topic_prob)
-            #     word_distribution.change_bar_values(word_prob)
-            #     # self.add(topic_distribution, word_distribution)
-
-            self.play(Wait(1))
-
-            for word_index in range(5):
-                topic = np.argmax(multinomial.rvs(1, topic_prob))
-                word = (
-                    np.argmax(
-                        multinomial.rvs(1, word_prob[5 * topic : 5 * (topic + 1)])
-                    )
-                    + 5 * topic
-                )
-                topic_symbol = create_topic_symbol(row, topic)
-
-                if doc_index != 0 and word_index == 0:
-                    # self.play(FadeOut(arrow_topic), FadeOut(arrow_word))
-                    new_row = VGroup(Tex(f"doc {doc_index+1}: "))
-                    new_row.next_to(row, DOWN, buff=0.1, aligned_edge=LEFT)
-                    self.add(new_row)
-                    row = new_row
-                    topic_symbol = create_topic_symbol(row, topic)
-
-                if word_index == 0:
-                    arrow_topic.next_to(topic_distribution[0][topic], UP, buff=0.1)
-                    arrow_word.next_to(
-                        word_distribution[0][word],
-                        UP,
-                        buff=0.1,
-                    )
-                    self.play(
-                        FadeIn(topic_symbol),
-                        FadeIn(arrow_topic),
-                    )
-                    self.play(FadeIn(arrow_word))
-                else:
-                    self.play(
-                        FadeIn(topic_symbol),
-                        arrow_topic.animate.next_to(
-                            topic_distribution[0][topic], UP, buff=0.1
-                        ),
-                    )
-                    self.play(
-                        arrow_word.animate.next_to(
-                            word_distribution[0][word],
-                            UP,
-                            buff=0.1,
-                        ),
-                    )
-
-                word_symbol = create_word_token(words[word])
-                word_symbol.next_to(
-                    word_distribution[0][word], DOWN, buff=0.3, aligned_edge=DOWN
-                )
+            self.arrow_word.next_to(
+                self.word_distribution.bars.get_bar_top(word), UP, buff=0.1
+            )
+            self.add(self.arrow_topic, self.arrow_word)
 
-                self.play(word_symbol.animate.move_to(topic_symbol.get_center()))
-                self.play(FadeOut(topic_symbol), run_time=0.5)
-
-        #     for word_index in range(6):
-        #         topic, word = draw_topic_and_word()
-        #         topic_symbol = create_topic_symbol(row, topic)
-
-        #         if word_index == 0:
-        #             arrow_topic.next_to(topic_distribution[0][topic], UP, buff=0.1)
-        #             self.play(
-        #                 FadeIn(topic_symbol),
-        #                 FadeIn(arrow_topic),
-        #             )
-        #         else:
-        #             self.play(
-        #                 arrow_topic.animate.next_to(
-        #                     topic_distribution[0][topic],
-        #                     UP,
-        #                     buff=0.1,
-        #                 ),
-        #                 run_time=0.25,
-        #             )
-        #             self.play(FadeIn(topic_symbol), run_time=0.5)
-        return
-        for doc_index, word_index in product(np.arange(3), np.arange(6)):
-            topic = np.argmax(multinomial.rvs(1, topic_prob))
-            word = (
-                np.argmax(multinomial.rvs(1, [word_prob_1, word_prob_2][topic]))
-                + 5 * topic
+    def animate_document(self, corpus, doc_index):
+        """Animates a document at the configured animation level."""
+        if self.animation_level == "full":
+            self.animate_tokens(corpus, doc_index)
+            return
+        self.play(
+            self.topic_distribution.bars.animate.change_bar_values(
+                corpus.topic_prob[doc_index]
+            ),
+            self.word_distribution.bars.animate.change_bar_values(
+                corpus.word_prob[doc_index].ravel()
+            ),
+        )
+        if self.animation_level == "per-document":
+            self.animate_row(corpus, doc_index)
+        else:
+            self.write_row(corpus, doc_index)
+
+    def animate_row(self, corpus, doc_index):
+        """Moves all words of a document into a new row in a single play."""
+        row = self.new_row(doc_index)
+        self.add(row[0])
+        word_symbols = []
+        flights = []
+        for word_index in range(corpus.topics.shape[1]):
+            topic, word = self.token(corpus, doc_index, word_index)
+            topic_symbol = create_topic_symbol(row, topic)
+            word_symbol = create_word_token(words[word])
+            word_symbol.next_to(
+                self.word_distribution.bars.get_bar_bottom(word),
+                DOWN,
+                buff=0.3,
+                aligned_edge=DOWN,
             )
-            if doc_index > 0 and word_index == 0:
-                self.play(FadeOut(arrow_topic), FadeOut(arrow_word))
+            word_symbols.append(word_symbol)
+            flights.append(word_symbol.animate.move_to(topic_symbol.get_center()))
+        self.play(LaggedStart(*flights, lag_ratio=0.5))
+        row.add(*word_symbols)
+
+    def animate_tokens(self, corpus, doc_index):
+        """Animates the drawing of every topic and word of a document."""
+        topic_distribution = self.topic_distribution
+        word_distribution = self.word_distribution
+        arrow_topic = self.arrow_topic
+        arrow_word = self.arrow_word
+
+        topic_prob = corpus.topic_prob[doc_index]
+        word_prob = corpus.word_prob[doc_index].ravel()
+        row = self.new_row(doc_index)
+        if doc_index == 0:
+            # the first row is visible from the start
+            self.add(row)
+        else:
+            self.play(FadeOut(arrow_topic), FadeOut(arrow_word))
+        self.play(topic_distribution.bars.animate.change_bar_values(topic_prob))
+        self.play(word_distribution.bars.animate.change_bar_values(word_prob))
+        self.play(Wait(1))
+
+        self.add(row)
+        for word_index in range(corpus.topics.shape[1]):
+            topic, word = self.token(corpus, doc_index, word_index)
+            topic_symbol = create_topic_symbol(row, topic)
+
             if word_index == 0:
-                self.play(
-                    topic_distribution[0].animate.change_bar_values(
-                        probabilities[doc_index]
-                    )
+                arrow_topic.next_to(
+                    topic_distribution.bars.get_bar_top(topic), UP, buff=0.1
                 )
-                self.play(
-                    word_distribution[0].animate.change_bar_values(
-                        sum(word_probabilities[doc_index].values(), []),
-                    ),
+                arrow_word.next_to(
+                    word_distribution.bars.get_bar_top(word),
+                    UP,
+                    buff=0.1,
                 )
-            if doc_index != 0 and word_index == 0:
-                new_row = VGroup(Tex(f"doc {doc_index+1}: "))
-                new_row.next_to(row, DOWN, buff=0.1, aligned_edge=LEFT)
-                self.add(new_row)
-                row = new_row
-            value = np.random.choice([0, 1], p=probabilities[doc_index])
-            topic_symbol = create_topic_symbol(row, value)
-            row.add(topic_symbol)
-            if word_index == 0:
-                arrow_topic.next_to(topic_distribution[0][value], UP, buff=0.1)
                 self.play(
                     FadeIn(topic_symbol),
                     FadeIn(arrow_topic),
                 )
+                self.play(FadeIn(arrow_word))
             else:
                 self.play(
+                    FadeIn(topic_symbol),
                     arrow_topic.animate.next_to(
-                        topic_distribution[0][value],
-                        UP,
-                        buff=0.1,
+                        topic_distribution.bars.get_bar_top(topic), UP, buff=0.1
                     ),
-                    run_time=0.25,
-                )
-                self.play(FadeIn(topic_symbol), run_time=0.5)
-            topics = list(word_probabilities[doc_index].keys())
-            topic = topics[value]
-            value = np.random.choice(
-                np.arange(5), p=word_probabilities[doc_index][topic]
-            )
-            word_symbol = create_word_token(value, topic)
-            word_symbol.move_to(topic_symbol.get_center())
-            bar = word_distribution[0][0][value + 5 * topics.index(topic)]
-            if word_index == 0:
-                arrow_word.next_to(
-                    bar,
-                    UP,
-                    buff=0.1,
                 )
-                self.play(FadeIn(arrow_word))
-            else:
                 self.play(
                     arrow_word.animate.next_to(
-                        bar,
+                        word_distribution.bars.get_bar_top(word),
                         UP,
                         buff=0.1,
                     ),
-                    run_time=0.25,
                 )
-            self.play(FadeIn(word_symbol), FadeOut(topic_symbol), run_time=0.5)
+
+            word_symbol = create_word_token(words[word])
+            word_symbol.next_to(
+                word_distribution.bars.get_bar_bottom(word),
+                DOWN,
+                buff=0.3,
+                aligned_edge=DOWN,
+            )
+
+            self.play(word_symbol.animate.move_to(topic_symbol.get_center()))
+            self.play(FadeOut(topic_symbol), run_time=0.5)
+            row.add(word_symbol)
+
+    def construct(self):
+        if self.animation_level not in ANIMATION_LEVELS:
+            msg = f"animation_level must be one of {ANIMATION_LEVELS}"
+            raise ValueError(msg)
+        corpus = self.sample()
+        self.setup_layout()
+
+        # documents before the selected range are shown in their final state,
+        # so a single document can be re-rendered from a recorded trace
+        first, last = parse_documents(self.documents, len(corpus.topics))
+        for doc_index in range(first):
+            self.fill_document(corpus, doc_index)
+        for doc_index in range(first, last):
+            self.animate_document(corpus, doc_index)